@@ -7,14 +7,35 @@ Provides current date/time information and handles natural language temporal que
 
 import logging
 from datetime import datetime, timedelta, date
-from dateutil.relativedelta import relativedelta
-from dateutil.parser import parse as dateutil_parse
 import calendar
 import re
+from functools import lru_cache
 from typing import Dict, Any
 
 logger = logging.getLogger(__name__)
 
+_WEEKDAYS = {
+    "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
+    "friday": 4, "saturday": 5, "sunday": 6
+}
+
+# Resolved once; calendar.day_name/month_name call strftime on every lookup
+_DAY_NAMES = tuple(calendar.day_name)
+_MONTH_NAMES = tuple(calendar.month_name)
+
+# Exact expressions: query -> (day offset from today or None, refers to now)
+_BASIC_EXPRESSIONS = {
+    "today": (0, True),
+    "now": (0, True),
+    "yesterday": (-1, False),
+    "tomorrow": (1, False),
+    "current time": (None, True),
+    "time now": (None, True),
+    "what time is it": (None, True),
+}
+
+_MONTH_LENGTHS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
 def get_temporal_info(temporal_query: str) -> Dict[str, Any]:
     """
     Get comprehensive temporal information for any date/time query.
@@ -39,49 +60,57 @@ def get_temporal_info(temporal_query: str) -> Dict[str, Any]:
 
         logger.info(f"Processing temporal query: '{query}'")
 
-        # Initialize result with current context
-        result = {
-            "query": temporal_query,
-            "current_datetime": now.isoformat(),
-            "current_date": today.isoformat(),
-            "current_time": now.strftime("%H:%M:%S"),
-            "current_year": now.year,
-            "current_month": now.month,
-            "current_day": now.day,
-            "current_weekday": now.strftime("%A"),
-            "timezone": str(now.astimezone().tzinfo)
-        }
+        # ISO string is built once and sliced for the date and time fields
+        now_iso = now.isoformat()
 
         # Parse the temporal query
         target_date, target_datetime = _parse_temporal_expression(query, now, today)
 
+        target_info = {}
         if target_date:
             # Add comprehensive information about the target date
-            result.update({
+            target_info = {
                 "target_date": target_date.isoformat(),
                 "target_year": target_date.year,
                 "target_month": target_date.month,
                 "target_day": target_date.day,
-                "target_weekday": target_date.strftime("%A"),
-                "target_month_name": target_date.strftime("%B"),
-                "formatted_date": target_date.strftime("%B %d, %Y"),
+                "target_weekday": _DAY_NAMES[target_date.weekday()],
+                "target_month_name": _MONTH_NAMES[target_date.month],
+                "formatted_date": f"{_MONTH_NAMES[target_date.month]} {target_date.day:02d}, {target_date.year}",
                 "days_from_today": (target_date - today).days,
                 "is_past": target_date < today,
                 "is_future": target_date > today,
                 "is_today": target_date == today
-            })
+            }
 
+        datetime_info = {}
         if target_datetime:
-            result.update({
-                "target_datetime": target_datetime.isoformat(),
-                "target_time": target_datetime.strftime("%H:%M:%S"),
+            target_iso = target_datetime.isoformat()
+            datetime_info = {
+                "target_datetime": target_iso,
+                "target_time": target_iso[11:19],
                 "hours_from_now": round((target_datetime - now).total_seconds() / 3600, 2)
-            })
+            }
 
-        # Add contextual information
-        result.update(_get_contextual_info(query, now, today))
+        result = {
+            "query": temporal_query,
+            "current_datetime": now_iso,
+            "current_date": now_iso[:10],
+            "current_time": now_iso[11:19],
+            "current_year": now.year,
+            "current_month": now.month,
+            "current_day": now.day,
+            "current_weekday": _DAY_NAMES[now.weekday()],
+            "timezone": str(now.astimezone().tzinfo),
+            **target_info,
+            **datetime_info,
+            # Add contextual information
+            **_get_contextual_info(today)
+        }
 
-        logger.debug(f"Temporal query result: {result}")
+        # Skip building the large dict repr unless debug logging is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Temporal query result: %s", result)
         return {"status": "success", "data": result}
 
     except Exception as e:
@@ -95,192 +124,209 @@ def get_temporal_info(temporal_query: str) -> Dict[str, Any]:
 
 def _parse_temporal_expression(query: str, now: datetime, today: date) -> tuple:
     """Parse temporal expression and return target date/datetime."""
-    target_date = None
-    target_datetime = None
-
-    # Basic temporal expressions
-    if query in ["today", "now"]:
-        target_date = today
-        target_datetime = now
-
-    elif query == "yesterday":
-        target_date = today - timedelta(days=1)
-
-    elif query == "tomorrow":
-        target_date = today + timedelta(days=1)
-
-    elif query in ["current time", "time now", "what time is it"]:
-        target_datetime = now
-
-    # Days of the week
-    elif "last" in query and any(day in query for day in ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]):
-        target_date = _get_last_weekday(query, today)
-
-    elif "next" in query and any(day in query for day in ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]):
-        target_date = _get_next_weekday(query, today)
-
-    elif "this" in query and any(day in query for day in ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]):
-        target_date = _get_this_weekday(query, today)
-
-    # Relative expressions with numbers
-    elif re.search(r'\d+\s*(day|week|month|year)s?\s*(ago|from now|later)', query):
-        target_date = _parse_relative_expression(query, today)
-
-    # Period expressions
-    elif "this week" in query:
-        target_date = _get_week_start(today)
-
-    elif "last week" in query:
-        target_date = _get_week_start(today - timedelta(weeks=1))
-
-    elif "next week" in query:
-        target_date = _get_week_start(today + timedelta(weeks=1))
-
-    elif "this month" in query:
-        target_date = today.replace(day=1)
-
-    elif "last month" in query:
-        target_date = (today.replace(day=1) - timedelta(days=1)).replace(day=1)
-
-    elif "next month" in query:
-        target_date = (today.replace(day=1) + relativedelta(months=1))
+    target_date, uses_now = _resolve_temporal_expression(query, today)
+    return target_date, now if uses_now else None
 
-    elif "this year" in query:
-        target_date = today.replace(month=1, day=1)
-
-    elif "last year" in query:
-        target_date = today.replace(year=today.year-1, month=1, day=1)
-
-    elif "next year" in query:
-        target_date = today.replace(year=today.year+1, month=1, day=1)
-
-    # Beginning/end expressions
-    elif "beginning of" in query or "start of" in query:
-        target_date = _get_period_start(query, today)
-
-    elif "end of" in query:
-        target_date = _get_period_end(query, today)
+@lru_cache(maxsize=512)
+def _resolve_temporal_expression(query: str, today: date) -> tuple:
+    """
+    Resolve a temporal expression relative to a given day.
 
-    return target_date, target_datetime
+    The result only depends on the query and the current date, so repeated
+    queries are served from cache. Returns the target date (or None) and
+    whether the expression refers to the current moment.
+    """
+    basic = _BASIC_EXPRESSIONS.get(query)
+    if basic is not None:
+        day_offset, uses_now = basic
+        if day_offset is None:
+            return None, uses_now
+        return today + timedelta(days=day_offset), uses_now
+
+    weekday = _match_weekday(query)
+    if weekday is not None:
+        return _resolve_weekday(*weekday, today), False
+
+    match = _TEMPORAL_RE.search(query)
+    if not match:
+        return None, False
+    return _TEMPORAL_HANDLERS[match.lastgroup](match, today)
+
+def _match_weekday(query: str) -> tuple | None:
+    """
+    Find a weekday expression like 'last friday', 'friday last week' or
+    'next week monday'.
 
-def _get_last_weekday(query: str, today: date) -> date:
+    The modifier and day name may appear in either order with other words
+    between them, so this is a containment check rather than part of
+    _TEMPORAL_RE. Returns (modifier, day number) or None.
+    """
+    day_num = next((num for name, num in _WEEKDAYS.items() if name in query), None)
+    if day_num is None:
+        return None
+    modifier = next((mod for mod in ("last", "next", "this") if mod in query), None)
+    if modifier is None:
+        return None
+    return modifier, day_num
+
+def _resolve_weekday(modifier: str, day_num: int, today: date) -> date:
+    """Resolve a weekday relative to today for the 'last', 'next' or 'this' modifier."""
+    if modifier == "last":
+        return _get_last_weekday(day_num, today)
+    if modifier == "next":
+        return _get_next_weekday(day_num, today)
+    return _get_this_weekday(day_num, today)
+
+def _handle_relative(match: re.Match, today: date) -> tuple:
+    """Handle expressions like '3 days ago' or '2 weeks from now'."""
+    return _parse_relative_expression(match, today), False
+
+def _handle_period(match: re.Match, today: date) -> tuple:
+    """Handle expressions like 'this week', 'last month' or 'next year'."""
+    modifier = match.group("period_mod")
+    unit = match.group("period_unit")
+
+    if unit == "week":
+        if modifier == "last":
+            return _get_week_start(today - timedelta(weeks=1)), False
+        if modifier == "next":
+            return _get_week_start(today + timedelta(weeks=1)), False
+        return _get_week_start(today), False
+
+    if unit == "month":
+        if modifier == "last":
+            return (today.replace(day=1) - timedelta(days=1)).replace(day=1), False
+        if modifier == "next":
+            return _add_months(today.replace(day=1), 1), False
+        return today.replace(day=1), False
+
+    if modifier == "last":
+        return today.replace(year=today.year - 1, month=1, day=1), False
+    if modifier == "next":
+        return today.replace(year=today.year + 1, month=1, day=1), False
+    return today.replace(month=1, day=1), False
+
+def _handle_period_start(match: re.Match, today: date) -> tuple:
+    """Handle expressions like 'beginning of month' or 'start of the week'."""
+    return _get_period_start(match.group("start_unit"), today), False
+
+def _handle_period_end(match: re.Match, today: date) -> tuple:
+    """Handle expressions like 'end of month' or 'end of the year'."""
+    return _get_period_end(match.group("end_unit"), today), False
+
+# Each alternative is wrapped in an outer named group so that match.lastgroup
+# names the handler to dispatch to. Alternatives are ordered by precedence;
+# weekday expressions are matched before this by _match_weekday.
+_TEMPORAL_RE = re.compile(
+    r'(?P<relative>(?P<relative_amount>\d+)\s*(?P<relative_unit>day|week|month|year)s?\s*'
+    r'(?P<relative_dir>ago|from now|later))'
+    r'|(?P<period_start>(?:beginning|start)\s+of\s+(?:the\s+|this\s+)?(?P<start_unit>week|month|year))'
+    r'|(?P<period_end>end\s+of\s+(?:the\s+|this\s+)?(?P<end_unit>week|month|year))'
+    r'|(?P<period>(?P<period_mod>this|last|next)\s+(?P<period_unit>week|month|year))'
+)
+
+_TEMPORAL_HANDLERS = {
+    "relative": _handle_relative,
+    "period_start": _handle_period_start,
+    "period_end": _handle_period_end,
+    "period": _handle_period,
+}
+
+def _get_last_weekday(day_num: int, today: date) -> date:
     """Get the date of the last occurrence of a weekday."""
-    weekdays = {
-        "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
-        "friday": 4, "saturday": 5, "sunday": 6
-    }
-
-    for day_name, day_num in weekdays.items():
-        if day_name in query:
-            days_back = (today.weekday() - day_num) % 7
-            if days_back == 0:  # Same day, go back a week
-                days_back = 7
-            return today - timedelta(days=days_back)
-
-    return today
+    # Same day goes back a full week
+    days_back = (today.weekday() - day_num) % 7 or 7
+    return today - timedelta(days=days_back)
 
-def _get_next_weekday(query: str, today: date) -> date:
+def _get_next_weekday(day_num: int, today: date) -> date:
     """Get the date of the next occurrence of a weekday."""
-    weekdays = {
-        "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
-        "friday": 4, "saturday": 5, "sunday": 6
-    }
-
-    for day_name, day_num in weekdays.items():
-        if day_name in query:
-            days_ahead = (day_num - today.weekday()) % 7
-            if days_ahead == 0:  # Same day, go forward a week
-                days_ahead = 7
-            return today + timedelta(days=days_ahead)
-
-    return today
+    # Same day goes forward a full week
+    days_ahead = (day_num - today.weekday()) % 7 or 7
+    return today + timedelta(days=days_ahead)
 
-def _get_this_weekday(query: str, today: date) -> date:
+def _get_this_weekday(day_num: int, today: date) -> date:
     """Get the date of a weekday in the current week."""
-    weekdays = {
-        "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
-        "friday": 4, "saturday": 5, "sunday": 6
-    }
-
-    for day_name, day_num in weekdays.items():
-        if day_name in query:
-            days_diff = day_num - today.weekday()
-            return today + timedelta(days=days_diff)
-
-    return today
-
-def _parse_relative_expression(query: str, today: date) -> date:
-    """Parse expressions like '3 days ago', 'in 2 weeks', etc."""
-    # Match patterns like "3 days ago", "in 2 weeks", "5 months from now"
-    pattern = r'(\d+)\s*(day|week|month|year)s?\s*(ago|from now|later)'
-    match = re.search(pattern, query)
-
-    if match:
-        amount = int(match.group(1))
-        unit = match.group(2)
-        direction = match.group(3)
-
-        if direction == "ago":
-            amount = -amount
-
-        if unit == "day":
-            return today + timedelta(days=amount)
-        elif unit == "week":
-            return today + timedelta(weeks=amount)
-        elif unit == "month":
-            return today + relativedelta(months=amount)
-        elif unit == "year":
-            return today + relativedelta(years=amount)
-
-    return today
+    return today + timedelta(days=day_num - today.weekday())
+
+def _parse_relative_expression(match: re.Match, today: date) -> date:
+    """Resolve a matched expression like '3 days ago' or '5 months from now'."""
+    amount = int(match.group("relative_amount"))
+    unit = match.group("relative_unit")
+
+    if match.group("relative_dir") == "ago":
+        amount = -amount
+
+    if unit == "day":
+        return today + timedelta(days=amount)
+    elif unit == "week":
+        return today + timedelta(weeks=amount)
+    elif unit == "month":
+        return _add_months(today, amount)
+    return _add_months(today, amount * 12)
+
+def _days_in_month(year: int, month: int) -> int:
+    """Get the number of days in a month without going through calendar.monthrange."""
+    if month == 2 and (year & 3) == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _MONTH_LENGTHS[month - 1]
+
+def _add_months(target_date: date, months: int) -> date:
+    """Shift a date by whole months, clamping the day to the target month's length."""
+    month_index = target_date.month - 1 + months
+    year = target_date.year + month_index // 12
+    month = month_index % 12 + 1
+    return target_date.replace(year=year, month=month, day=min(target_date.day, _days_in_month(year, month)))
 
 def _get_week_start(target_date: date) -> date:
     """Get the Monday of the week containing the target date."""
     return target_date - timedelta(days=target_date.weekday())
 
-def _get_period_start(query: str, today: date) -> date:
+def _get_period_start(unit: str, today: date) -> date:
     """Get the start of a period (month, year, etc.)."""
-    if "month" in query:
+    if unit == "month":
         return today.replace(day=1)
-    elif "year" in query:
+    elif unit == "year":
         return today.replace(month=1, day=1)
-    elif "week" in query:
+    elif unit == "week":
         return _get_week_start(today)
     return today
 
-def _get_period_end(query: str, today: date) -> date:
+def _get_period_end(unit: str, today: date) -> date:
     """Get the end of a period (month, year, etc.)."""
-    if "month" in query:
-        last_day = calendar.monthrange(today.year, today.month)[1]
+    if unit == "month":
+        last_day = _days_in_month(today.year, today.month)
         return today.replace(day=last_day)
-    elif "year" in query:
+    elif unit == "year":
         return today.replace(month=12, day=31)
-    elif "week" in query:
+    elif unit == "week":
         return _get_week_start(today) + timedelta(days=6)
     return today
 
-def _get_contextual_info(query: str, now: datetime, today: date) -> Dict[str, Any]:
-    """Add contextual information based on the query."""
-    context = {}
-
-    # Add week information
-    context["week_start"] = _get_week_start(today).isoformat()
-    context["week_end"] = (_get_week_start(today) + timedelta(days=6)).isoformat()
-
-    # Add month information
-    context["month_start"] = today.replace(day=1).isoformat()
-    last_day = calendar.monthrange(today.year, today.month)[1]
-    context["month_end"] = today.replace(day=last_day).isoformat()
-
-    # Add year information
-    context["year_start"] = today.replace(month=1, day=1).isoformat()
-    context["year_end"] = today.replace(month=12, day=31).isoformat()
-
-    # Add useful relative dates
-    context["yesterday"] = (today - timedelta(days=1)).isoformat()
-    context["tomorrow"] = (today + timedelta(days=1)).isoformat()
+@lru_cache(maxsize=8)
+def _get_contextual_info(today: date) -> Dict[str, Any]:
+    """
+    Build week/month/year context for the given day.
 
-    return context
+    Cached per day; callers must copy the result rather than mutate it.
+    """
+    week_start = _get_week_start(today)
+    month_start = today.replace(day=1)
+    last_day = _days_in_month(today.year, today.month)
+
+    return {
+        # Week information
+        "week_start": week_start.isoformat(),
+        "week_end": (week_start + timedelta(days=6)).isoformat(),
+        # Month information
+        "month_start": month_start.isoformat(),
+        "month_end": month_start.replace(day=last_day).isoformat(),
+        # Year information
+        "year_start": today.replace(month=1, day=1).isoformat(),
+        "year_end": today.replace(month=12, day=31).isoformat(),
+        # Useful relative dates
+        "yesterday": (today - timedelta(days=1)).isoformat(),
+        "tomorrow": (today + timedelta(days=1)).isoformat(),
+    }
 
 # Tool execution wrapper for the agent system
 def execute_get_temporal_info(temporal_query: str, username: str = "admin") -> Dict[str, Any]:
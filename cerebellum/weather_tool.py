@@ -5,13 +5,161 @@ Weather forecast functionality using OpenWeather API.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
-from datetime import date, datetime
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from datetime import date, datetime, time, timedelta
 from config import OPENWEATHER_API_KEY
+from stem.jsonutils import parse_json
 
 # Set up logging for this module
 logger = logging.getLogger(__name__)
 
+# Shared session so repeated calls reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+
+_GEOCODE_URL = "https://api.openweathermap.org/geo/1.0/direct"
+_FORECAST_URL = "https://api.openweathermap.org/data/2.5/forecast"
+
+# City coordinates do not change, so lookups are cached for the lifetime of the
+# process. Request errors are not cached.
+_GEOCODE_CACHE: dict[str, tuple[float, float] | None] = {}
+_GEOCODE_CACHE_SIZE = 256
+
+def _cache_coordinates(city: str, geo_data: list) -> tuple[float, float] | None:
+    """
+    Extract coordinates from a geocoding response and cache them.
+    
+    Args:
+        city (str): Normalized city name.
+        geo_data (list): Parsed geocoding API response.
+        
+    Returns:
+        tuple[float, float] | None: (lat, lon) or None if the city is unknown.
+    """
+    coordinates = (geo_data[0]['lat'], geo_data[0]['lon']) if geo_data else None
+    if len(_GEOCODE_CACHE) >= _GEOCODE_CACHE_SIZE:
+        # Evict the oldest entry; dicts preserve insertion order
+        del _GEOCODE_CACHE[next(iter(_GEOCODE_CACHE))]
+    _GEOCODE_CACHE[city] = coordinates
+    return coordinates
+
+def _geocode(city: str) -> tuple[float, float] | None:
+    """
+    Resolve a city name to coordinates using the OpenWeather geocoding API.
+    
+    Args:
+        city (str): Normalized city name.
+        
+    Returns:
+        tuple[float, float] | None: (lat, lon) or None if the city is unknown.
+    """
+    if city in _GEOCODE_CACHE:
+        return _GEOCODE_CACHE[city]
+    
+    geo_response = _SESSION.get(
+        _GEOCODE_URL,
+        params={"q": city, "limit": 1, "appid": OPENWEATHER_API_KEY},
+        timeout=10
+    )
+    geo_response.raise_for_status()
+    return _cache_coordinates(city, parse_json(geo_response.content))
+
+def _local_day_buckets(first_day: date, last_day: date) -> tuple[list[float], list[str]]:
+    """
+    Build local-midnight Unix timestamps for a range of days.
+    
+    Forecast entries can then be assigned to a day with a bisect over the
+    boundaries instead of converting each timestamp to a date.
+    
+    Args:
+        first_day (date): First day of the range.
+        last_day (date): Last day of the range (inclusive).
+        
+    Returns:
+        tuple[list[float], list[str]]: Day start boundaries (plus the end of the
+        last day) and the matching YYYY-MM-DD keys. Both are empty if the range is.
+    """
+    boundaries = []
+    day_keys = []
+    day = first_day
+    while day <= last_day:
+        boundaries.append(datetime.combine(day, time.min).timestamp())
+        day_keys.append(day.isoformat())
+        day += timedelta(days=1)
+    if day_keys:
+        boundaries.append(datetime.combine(day, time.min).timestamp())
+    return boundaries, day_keys
+
+def _parse_date_range(start_date: str | None, end_date: str | None) -> tuple[date, date]:
+    """
+    Resolve the requested date range, defaulting to today.
+    
+    Raises:
+        ValueError: If a date is not in YYYY-MM-DD format.
+    """
+    start_date_obj = date.fromisoformat(start_date) if start_date else date.today()
+    end_date_obj = date.fromisoformat(end_date) if end_date else start_date_obj
+    return start_date_obj, end_date_obj
+
+def _summarize_forecast(city: str, start_date_obj: date, end_date_obj: date, forecast_data: dict) -> dict:
+    """
+    Reduce 3-hourly forecast entries to per-day min/max temperatures and the
+    most common description within the requested range.
+    
+    Args:
+        city (str): City name as requested by the user.
+        start_date_obj (date): First day of the range.
+        end_date_obj (date): Last day of the range (inclusive).
+        forecast_data (dict): Parsed forecast API response.
+        
+    Returns:
+        dict: Status and weather data.
+    """
+    forecasts = forecast_data.get('list', [])
+    
+    # Only the days covered by both the request and the forecast need buckets
+    if forecasts:
+        timestamps = [forecast['dt'] for forecast in forecasts]
+        start_date_obj = max(start_date_obj, date.fromtimestamp(min(timestamps)))
+        end_date_obj = min(end_date_obj, date.fromtimestamp(max(timestamps)))
+    boundaries, day_keys = _local_day_buckets(start_date_obj, end_date_obj)
+    
+    # Process forecast data: per day, a list of temperatures and description counts
+    daily_forecasts = defaultdict(lambda: ([], Counter()))
+    if day_keys:
+        start_ts, end_ts = boundaries[0], boundaries[-1]
+        for forecast in forecasts:
+            timestamp = forecast['dt']
+            if not start_ts <= timestamp < end_ts:
+                continue
+            temps, descriptions = daily_forecasts[day_keys[bisect_right(boundaries, timestamp) - 1]]
+            temps.append(forecast['main']['temp'])
+            descriptions[forecast['weather'][0]['description']] += 1
+    
+    if not daily_forecasts:
+        return {"status": "success", "data": [], "message": f"No forecast data available for the selected dates in {city}."}
+    
+    # Format results
+    results = []
+    for day, (temps, descriptions) in sorted(daily_forecasts.items()):
+        results.append({
+            "date": day, 
+            "city": city, 
+            "temp_min_celsius": min(temps),
+            "temp_max_celsius": max(temps), 
+            "description": descriptions.most_common(1)[0][0]
+        })
+    
+    return {"status": "success", "data": results}
+
 def execute_get_weather_forecast(city: str, start_date: str | None = None, end_date: str | None = None) -> dict:
     """
     Get the weather forecast for a specific city and date range.
@@ -25,62 +173,25 @@ def execute_get_weather_forecast(city: str, start_date: str | None = None, end_d
         dict: Status and weather data or error message.
     """
     try:
-        # Check if API key is configured
-        if not OPENWEATHER_API_KEY:
-            return {
-                "status": "error",
-                "message": "Weather forecast is not available. OpenWeather API key is not configured. Please set OPENWEATHER_API_KEY environment variable to enable weather functionality."
-            }
-        
-        today = date.today()
-        start_date_obj = date.fromisoformat(start_date) if start_date else today
-        end_date_obj = date.fromisoformat(end_date) if end_date else start_date_obj
+        start_date_obj, end_date_obj = _parse_date_range(start_date, end_date)
         
         # Get city coordinates
-        geo_url = f"http://api.openweathermap.org/geo/1.0/direct?q={city}&limit=1&appid={OPENWEATHER_API_KEY}"
-        geo_response = requests.get(geo_url)
-        geo_response.raise_for_status()
-        geo_data = geo_response.json()
+        coordinates = _geocode(city.strip().lower())
         
-        if not geo_data:
+        if not coordinates:
             return {"status": "error", "message": f"City not found: {city}"}
         
-        lat, lon = geo_data[0]['lat'], geo_data[0]['lon']
+        lat, lon = coordinates
         
         # Get weather forecast
-        forecast_url = f"https://api.openweathermap.org/data/2.5/forecast?lat={lat}&lon={lon}&appid={OPENWEATHER_API_KEY}&units=metric"
-        forecast_response = requests.get(forecast_url)
+        forecast_response = _SESSION.get(
+            _FORECAST_URL,
+            params={"lat": lat, "lon": lon, "appid": OPENWEATHER_API_KEY, "units": "metric"},
+            timeout=10
+        )
         forecast_response.raise_for_status()
-        forecast_data = forecast_response.json()
-        
-        # Process forecast data
-        daily_forecasts = {}
-        for forecast in forecast_data.get('list', []):
-            forecast_date = datetime.fromtimestamp(forecast['dt']).date()
-            if start_date_obj <= forecast_date <= end_date_obj:
-                day_str = forecast_date.isoformat()
-                if day_str not in daily_forecasts:
-                    daily_forecasts[day_str] = {"temps": [], "descriptions": {}}
-                daily_forecasts[day_str]["temps"].append(forecast['main']['temp'])
-                desc = forecast['weather'][0]['description']
-                daily_forecasts[day_str]["descriptions"][desc] = daily_forecasts[day_str]["descriptions"].get(desc, 0) + 1
-        
-        if not daily_forecasts:
-            return {"status": "success", "data": [], "message": f"No forecast data available for the selected dates in {city}."}
         
-        # Format results
-        results = []
-        for day, data in sorted(daily_forecasts.items()):
-            most_common_desc = max(data["descriptions"], key=data["descriptions"].get)
-            results.append({
-                "date": day, 
-                "city": city, 
-                "temp_min_celsius": min(data["temps"]),
-                "temp_max_celsius": max(data["temps"]), 
-                "description": most_common_desc
-            })
-        
-        return {"status": "success", "data": results}
+        return _summarize_forecast(city, start_date_obj, end_date_obj, parse_json(forecast_response.content))
         
     except requests.exceptions.RequestException as e:
         logger.error(f"Request error during weather forecast: {e}")
@@ -90,4 +201,16 @@ def execute_get_weather_forecast(city: str, start_date: str | None = None, end_d
         return {"status": "error", "message": f"Invalid date format: {e}"}
     except Exception as e:
         logger.error(f"An unexpected error occurred during weather forecast: {e}")
-        return {"status": "error", "message": f"An unexpected error occurred: {e}"} 
\ No newline at end of file
+        return {"status": "error", "message": f"An unexpected error occurred: {e}"}
+
+def _weather_forecast_unavailable(city: str, start_date: str | None = None, end_date: str | None = None) -> dict:
+    """Stand-in for execute_get_weather_forecast when no API key is configured."""
+    return {
+        "status": "error",
+        "message": "Weather forecast is not available. OpenWeather API key is not configured. Please set OPENWEATHER_API_KEY environment variable to enable weather functionality."
+    }
+
+# The API key is resolved once at import, so decide availability here instead
+# of checking it on every call
+if not OPENWEATHER_API_KEY:
+    execute_get_weather_forecast = _weather_forecast_unavailable
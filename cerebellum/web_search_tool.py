@@ -5,12 +5,57 @@ Web search functionality using Google Custom Search API.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 from config import GOOGLE_API_KEY, GOOGLE_CSE_ID
+from stem.jsonutils import parse_json
 
 # Set up logging for this module
 logger = logging.getLogger(__name__)
 
+# Shared session so repeated calls reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+
+_SEARCH_URL = "https://www.googleapis.com/customsearch/v1"
+
+def _search_params(query: str) -> dict:
+    """Build the Custom Search query parameters."""
+    return {
+        'key': GOOGLE_API_KEY,
+        'cx': GOOGLE_CSE_ID,
+        'q': query,
+        'num': 5
+    }
+
+def _format_search_results(search_results: dict) -> dict:
+    """
+    Reduce a Custom Search API response to title/link/snippet entries.
+    
+    Args:
+        search_results (dict): Parsed search API response.
+        
+    Returns:
+        dict: Status and search results.
+    """
+    formatted_results = []
+    for item in search_results.get("items", []):
+        formatted_results.append({
+            "title": item.get("title"),
+            "link": item.get("link"),
+            "snippet": item.get("snippet")
+        })
+    
+    if not formatted_results:
+        return {"status": "success", "data": "No search results found."}
+    
+    return {"status": "success", "data": formatted_results}
+
 def execute_web_search(query: str) -> dict:
     """
     Perform a web search using the Google Custom Search JSON API.
@@ -22,41 +67,26 @@ def execute_web_search(query: str) -> dict:
         dict: Status and search results or error message.
     """
     try:
-        # Check if API keys are configured
-        if not GOOGLE_API_KEY or not GOOGLE_CSE_ID:
-            return {
-                "status": "error", 
-                "message": "Web search is not available. Google API keys are not configured. Please set GOOGLE_API_KEY and GOOGLE_CSE_ID environment variables to enable web search functionality."
-            }
-        
-        url = "https://www.googleapis.com/customsearch/v1"
-        params = {
-            'key': GOOGLE_API_KEY,
-            'cx': GOOGLE_CSE_ID,
-            'q': query,
-            'num': 5
-        }
-        
-        response = requests.get(url, params=params)
+        response = _SESSION.get(_SEARCH_URL, params=_search_params(query), timeout=10)
         response.raise_for_status()
-        search_results = response.json()
         
-        formatted_results = []
-        for item in search_results.get("items", []):
-            formatted_results.append({
-                "title": item.get("title"),
-                "link": item.get("link"),
-                "snippet": item.get("snippet")
-            })
-        
-        if not formatted_results:
-            return {"status": "success", "data": "No search results found."}
-        
-        return {"status": "success", "data": formatted_results}
+        return _format_search_results(parse_json(response.content))
         
     except requests.exceptions.RequestException as e:
         logger.error(f"Request error during web search: {e}")
         return {"status": "error", "message": f"Failed to connect to search API: {e}"}
     except Exception as e:
         logger.error(f"An error occurred during web search: {e}")
-        return {"status": "error", "message": f"Failed to execute web search: {e}"} 
\ No newline at end of file
+        return {"status": "error", "message": f"Failed to execute web search: {e}"}
+
+def _web_search_unavailable(query: str) -> dict:
+    """Stand-in for execute_web_search when no API keys are configured."""
+    return {
+        "status": "error", 
+        "message": "Web search is not available. Google API keys are not configured. Please set GOOGLE_API_KEY and GOOGLE_CSE_ID environment variables to enable web search functionality."
+    }
+
+# The API keys are resolved once at import, so decide availability here instead
+# of checking them on every call
+if not GOOGLE_API_KEY or not GOOGLE_CSE_ID:
+    execute_web_search = _web_search_unavailable
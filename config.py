@@ -6,15 +6,22 @@ Handles API keys, database paths, and LLM model configuration for
 the conversational AI system with authentication and user management.
 """
 
+import importlib.util
 import os
 import logging
+import re
 from dotenv import load_dotenv
+from functools import lru_cache
 import sys
 
 # Set up logging for this module
 logger = logging.getLogger(__name__)
 
-load_dotenv()
+# Load .env once per process tree; the sentinel survives module reloads and is
+# inherited by worker processes, which also inherit the loaded variables
+if not os.environ.get("_TATLOCK_DOTENV_LOADED"):
+    load_dotenv()
+    os.environ["_TATLOCK_DOTENV_LOADED"] = "1"
 
 # Import system settings manager
 try:
@@ -25,9 +32,75 @@ except ImportError:
     USE_DATABASE_SETTINGS = False
     logger.warning("System settings manager not available, using environment variables")
 
+# Settings resolved at import; fetched together so startup runs one query
+# instead of one per key
+_PREFETCHED_SETTING_KEYS = (
+    "ollama_host", "ollama_timeout", "google_api_key", "google_cse_id",
+    "openweather_api_key", "hostname", "port", "allowed_origins",
+    "session_timeout", "max_login_attempts", "password_min_length", "debug_mode"
+)
+_prefetched_settings: dict[str, str | None] = {}
+
+def fetch_database_settings(setting_keys: tuple[str, ...] = _PREFETCHED_SETTING_KEYS) -> dict[str, str | None] | None:
+    """
+    Read several settings from the database with a single query.
+
+    Args:
+        setting_keys (tuple[str, ...]): The setting keys to read.
+
+    Returns:
+        dict[str, str | None] | None: Every requested key mapped to its database
+        value, or None where the database has no value; None if the database
+        could not be read.
+    """
+    if not USE_DATABASE_SETTINGS:
+        return None
+    try:
+        fetched = system_settings_manager.get_settings(list(setting_keys))
+    except Exception as e:
+        logger.warning(f"Failed to prefetch settings from database: {e}")
+        return None
+    if not fetched:
+        # Empty result may mean the query failed; fall back to per-key lookups
+        return None
+    return {key: fetched.get(key) for key in setting_keys}
+
+def prefetch_settings(setting_keys: tuple[str, ...] = _PREFETCHED_SETTING_KEYS) -> None:
+    """
+    Load several database settings with a single query for later lookups.
+    Keys missing from the database are remembered as None so lookups can go
+    straight to the environment variable. When a resolved settings snapshot
+    exists, its database values are used instead of querying.
+    """
+    snapshot = _resolved_settings_snapshot()
+    if snapshot:
+        _prefetched_settings.update(snapshot)
+        return
+    fetched = fetch_database_settings(setting_keys)
+    if fetched is not None:
+        _prefetched_settings.update(fetched)
+
+def clear_settings_cache() -> None:
+    """
+    Drop prefetched, cached and memoized setting values so the next lookup
+    through the config module (e.g. config.DEBUG_MODE) reads the database.
+    Names bound with `from config import NAME` keep their value until the
+    process restarts. The resolved settings snapshot is left alone; see
+    refresh_resolved_config() in stem/installation/config_snapshot.py.
+    """
+    global _settings_prefetched
+    _prefetched_settings.clear()
+    _settings_prefetched = False
+    get_setting_from_db_or_env.cache_clear()
+    # Values resolved through __getattr__ are memoized as module attributes
+    for name in _LAZY_ATTRIBUTES:
+        globals().pop(name, None)
+
+@lru_cache(maxsize=None)
 def get_setting_from_db_or_env(setting_key: str, env_key: str, default_value: str = "") -> str:
     """
     Get a setting value from database if available, otherwise from environment variable.
+    Results are cached; call clear_settings_cache() after changing a setting.
     
     Args:
         setting_key (str): Database setting key
@@ -37,7 +110,11 @@ def get_setting_from_db_or_env(setting_key: str, env_key: str, default_value: st
     Returns:
         str: The setting value
     """
-    if USE_DATABASE_SETTINGS:
+    if setting_key in _prefetched_settings:
+        db_value = _prefetched_settings[setting_key]
+        if db_value is not None:
+            return db_value
+    elif USE_DATABASE_SETTINGS:
         try:
             db_value = system_settings_manager.get_setting(setting_key)
             if db_value is not None:
@@ -83,41 +160,30 @@ def load_hardware_configuration() -> tuple[str, str]:
         fallback_model = os.getenv("OLLAMA_MODEL", "phi4-mini:3.8b-q4_K_M")
         return fallback_model, "unknown"
 
-# Global hardware configuration - loaded once at startup
-OLLAMA_MODEL, HARDWARE_PERFORMANCE_TIER = load_hardware_configuration()
-OLLAMA_HOST = get_setting_from_db_or_env("ollama_host", "OLLAMA_HOST", "http://localhost:11434")
-OLLAMA_TIMEOUT = int(get_setting_from_db_or_env("ollama_timeout", "OLLAMA_TIMEOUT", "30"))
-
-# --- Google Search API Credentials ---
-GOOGLE_API_KEY = get_setting_from_db_or_env("google_api_key", "GOOGLE_API_KEY")
-GOOGLE_CSE_ID = get_setting_from_db_or_env("google_cse_id", "GOOGLE_CSE_ID")
-
-# --- Weather API Key ---
-OPENWEATHER_API_KEY = get_setting_from_db_or_env("openweather_api_key", "OPENWEATHER_API_KEY")
+@lru_cache(maxsize=1)
+def _hardware_configuration() -> tuple[str, str]:
+    """Load the hardware configuration once; OLLAMA_MODEL and the tier share it."""
+    return load_hardware_configuration()
 
 # --- Database Paths ---
 SYSTEM_DB_PATH = os.getenv("SYSTEM_DB", "hippocampus/system.db")     # Authentication database
 
-# --- Server Configuration ---
-HOSTNAME = get_setting_from_db_or_env("hostname", "HOSTNAME", "localhost")
-PORT = int(get_setting_from_db_or_env("port", "PORT", "8000"))
-ALLOWED_ORIGINS = get_setting_from_db_or_env("allowed_origins", "ALLOWED_ORIGINS", "http://localhost:8000").split(",")
-
-# --- Security Configuration ---
-SESSION_TIMEOUT = int(get_setting_from_db_or_env("session_timeout", "SESSION_TIMEOUT", "3600"))
-MAX_LOGIN_ATTEMPTS = int(get_setting_from_db_or_env("max_login_attempts", "MAX_LOGIN_ATTEMPTS", "5"))
-PASSWORD_MIN_LENGTH = int(get_setting_from_db_or_env("password_min_length", "PASSWORD_MIN_LENGTH", "8"))
+_settings_prefetched = False
 
-# --- Debug Configuration ---
-DEBUG_MODE = get_setting_from_db_or_env("debug_mode", "DEBUG_MODE", "false").lower() == "true"
+def _resolve_setting(setting_key: str, env_key: str, default_value: str = "") -> str:
+    """Resolve a lazily loaded setting, prefetching all import-time settings on first use."""
+    global _settings_prefetched
+    if not _settings_prefetched:
+        _settings_prefetched = True
+        prefetch_settings()
+    return get_setting_from_db_or_env(setting_key, env_key, default_value)
 
-# --- Error Checking ---
-if not OPENWEATHER_API_KEY:
-    logger.warning("WARNING: OPENWEATHER_API_KEY not set. Weather functionality will be disabled.")
-if not GOOGLE_API_KEY:
-    logger.warning("WARNING: GOOGLE_API_KEY not set. Web search functionality will be disabled.")
-if not GOOGLE_CSE_ID:
-    logger.warning("WARNING: GOOGLE_CSE_ID not set. Web search functionality will be disabled.")
+def _resolve_api_key(setting_key: str, env_key: str, feature: str) -> str:
+    """Resolve an API key setting, warning once if it is not configured."""
+    value = _resolve_setting(setting_key, env_key)
+    if not value:
+        logger.warning(f"WARNING: {env_key} not set. {feature} functionality will be disabled.")
+    return value
 
 # For example, if you want to use a different database for testing
 if "pytest" in sys.modules:
@@ -131,17 +197,16 @@ else:
 Provides application metadata, such as the version number,
 read from a central location (pyproject.toml).
 """
-# Use tomllib if available (Python 3.11+), otherwise use tomli
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    try:
-        import tomli
-    except ImportError:
-        tomli = None
+# Matches the version key inside the [project] table without a full TOML parse
+_PROJECT_VERSION_RE = re.compile(rb'^\[project\][^\[]*?^version\s*=\s*"([^"]+)"', re.MULTILINE | re.DOTALL)
 
+@lru_cache(maxsize=1)
 def get_app_version():
-    """Reads the application version from pyproject.toml."""
+    """
+    Reads the application version from pyproject.toml.
+    The result is cached; only the head of the file is scanned unless the
+    version cannot be found there, in which case the full TOML is parsed.
+    """
     try:
         # The project root is one level up from this file's location
         project_root = os.path.dirname(os.path.abspath(__file__))
@@ -153,23 +218,115 @@ def get_app_version():
             project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
             toml_path = os.path.join(project_root, 'pyproject.toml')
 
+        with open(toml_path, "rb") as f:
+            match = _PROJECT_VERSION_RE.search(f.read(4096))
+        if match:
+            return match.group(1).decode()
 
+        # Full TOML parse; the parser is only imported when the fast path misses.
+        # Use tomllib if available (Python 3.11+), otherwise use tomli
         if sys.version_info >= (3, 11):
-            with open(toml_path, "rb") as f:
-                data = tomllib.load(f)
-        elif tomli:
-            with open(toml_path, "rb") as f:
-                data = tomli.load(f)
+            import tomllib as toml_parser
         else:
-            # This is a fallback if tomli is not installed on Python < 3.11
-            return "0.0.0-dev (tomli not installed)"
+            try:
+                import tomli as toml_parser
+            except ImportError:
+                # This is a fallback if tomli is not installed on Python < 3.11
+                return "0.0.0-dev (tomli not installed)"
+
+        with open(toml_path, "rb") as f:
+            data = toml_parser.load(f)
             
         return data["project"]["version"]
     except (FileNotFoundError, KeyError):
         # Fallback for when pyproject.toml is not found or malformed
         return "0.0.0-dev (pyproject.toml not found)"
 
-APP_VERSION = get_app_version()
+# --- Lazily Resolved Configuration ---
+# These values are resolved on first access through the module __getattr__ hook
+# (PEP 562) and then stored as ordinary module attributes. Importing config for
+# one value therefore does not run hardware detection, database lookups or the
+# pyproject.toml read for all of them. `from config import NAME` works as before.
+_LAZY_ATTRIBUTES = {
+    # LLM Configuration
+    "OLLAMA_MODEL": lambda: _hardware_configuration()[0],
+    "HARDWARE_PERFORMANCE_TIER": lambda: _hardware_configuration()[1],
+    "OLLAMA_HOST": lambda: _resolve_setting("ollama_host", "OLLAMA_HOST", "http://localhost:11434"),
+    "OLLAMA_TIMEOUT": lambda: int(_resolve_setting("ollama_timeout", "OLLAMA_TIMEOUT", "30")),
+    # Google Search API Credentials
+    "GOOGLE_API_KEY": lambda: _resolve_api_key("google_api_key", "GOOGLE_API_KEY", "Web search"),
+    "GOOGLE_CSE_ID": lambda: _resolve_api_key("google_cse_id", "GOOGLE_CSE_ID", "Web search"),
+    # Weather API Key
+    "OPENWEATHER_API_KEY": lambda: _resolve_api_key("openweather_api_key", "OPENWEATHER_API_KEY", "Weather"),
+    # Server Configuration
+    "HOSTNAME": lambda: _resolve_setting("hostname", "HOSTNAME", "localhost"),
+    "PORT": lambda: int(_resolve_setting("port", "PORT", "8000")),
+    "ALLOWED_ORIGINS": lambda: _resolve_setting("allowed_origins", "ALLOWED_ORIGINS", "http://localhost:8000").split(","),
+    # Security Configuration
+    "SESSION_TIMEOUT": lambda: int(_resolve_setting("session_timeout", "SESSION_TIMEOUT", "3600")),
+    "MAX_LOGIN_ATTEMPTS": lambda: int(_resolve_setting("max_login_attempts", "MAX_LOGIN_ATTEMPTS", "5")),
+    "PASSWORD_MIN_LENGTH": lambda: int(_resolve_setting("password_min_length", "PASSWORD_MIN_LENGTH", "8")),
+    # Debug Configuration
+    "DEBUG_MODE": lambda: _resolve_setting("debug_mode", "DEBUG_MODE", "false").lower() == "true",
+    # Application metadata
+    "APP_VERSION": get_app_version,
+}
+
+# --- Resolved Settings Snapshot ---
+# Like hardware_config.py, resolved_config.py holds pre-computed values: the
+# system.db values of the prefetched settings, as a DATABASE_SETTINGS dict. It is
+# written by `python -m stem.installation.config_snapshot` (run by the installer)
+# and rewritten when an admin changes a setting, and lets startup skip the
+# settings query. Only database values are stored, so environment variables and
+# defaults are still read live and keep their usual precedence.
+RESOLVED_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resolved_config.py")
+
+def load_resolved_settings_snapshot(path: str) -> dict[str, str | None]:
+    """
+    Read the database settings recorded in a resolved settings snapshot.
+
+    Args:
+        path (str): Path of the snapshot file.
+
+    Returns:
+        dict[str, str | None]: Setting key to database value (None where the
+        database had none), or an empty dict if there is no usable snapshot.
+    """
+    if not os.path.exists(path):
+        return {}
+    try:
+        spec = importlib.util.spec_from_file_location("resolved_config", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        settings = module.DATABASE_SETTINGS
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable {path}: {e}")
+        return {}
+    # A snapshot from an older release may lack newer keys; those are queried
+    if not isinstance(settings, dict) or not set(_PREFETCHED_SETTING_KEYS) <= set(settings):
+        logger.warning(f"Ignoring incomplete {path}; regenerate it with python -m stem.installation.config_snapshot")
+        return {}
+    return {key: settings[key] for key in _PREFETCHED_SETTING_KEYS}
+
+@lru_cache(maxsize=1)
+def _resolved_settings_snapshot() -> dict[str, str | None]:
+    """Load the resolved settings snapshot once, or an empty dict if none was generated."""
+    if "pytest" in sys.modules:
+        # Tests configure settings through their own system database
+        return {}
+    return load_resolved_settings_snapshot(RESOLVED_CONFIG_PATH)
+
+def __getattr__(name: str):
+    """Resolve a lazily loaded configuration value and memoize it as a module attribute."""
+    resolver = _LAZY_ATTRIBUTES.get(name)
+    if resolver is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = resolver()
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
 # --- Database Version ---
 # This tracks the current database schema version. It is automatically updated by the
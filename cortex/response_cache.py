@@ -0,0 +1,127 @@
+"""
+cortex/response_cache.py
+
+In-process cache of answers the model gave directly, without tools.
+Repeated questions from the same user in the same conversational context are
+answered from here instead of running the assessment, formatting and quality
+gate model calls again.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+# Set up logging for this module
+logger = logging.getLogger(__name__)
+
+# How long a cached answer stays valid, in seconds. Keys include the date but
+# not the time of day, so entries are kept short-lived
+RESPONSE_CACHE_TTL = 900.0
+# Maximum number of cached answers across all users
+RESPONSE_CACHE_SIZE = 256
+
+
+def normalize_question(question: str) -> str:
+    """
+    Reduce a question to a canonical form for cache lookups.
+    Case, surrounding and repeated whitespace, and trailing punctuation are ignored.
+
+    Args:
+        question (str): The user's question.
+    Returns:
+        str: The normalized question.
+    """
+    return ' '.join(question.casefold().split()).rstrip('?!. ')
+
+
+def context_fingerprint(history: List[Dict], compact_summary: Optional[str], date: str, location: str) -> str:
+    """
+    Fingerprint the context the assessment prompt sees, so an answer is only
+    reused where the model would have seen the same context.
+
+    Args:
+        history (List[Dict]): Recent conversation messages.
+        compact_summary (Optional[str]): Compacted conversation summary, if any.
+        date (str): The date shown to the model, without the time of day.
+        location (str): The user location shown to the model.
+    Returns:
+        str: Hex digest identifying the context.
+    """
+    # Mirrors PromptBuilder.build_assessment_prompt: the date and location, and
+    # all recent messages with a compact summary, otherwise only the last three
+    messages = history if compact_summary else history[-3:]
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (date, location, compact_summary or ''):
+        digest.update(str(part).encode())
+        digest.update(b'\0')
+    for message in messages:
+        digest.update(b'\0')
+        digest.update(str(message.get('role', '')).encode())
+        digest.update(b'\0')
+        digest.update(str(message.get('content', '')).encode())
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of (answer, topic) pairs with a time-to-live.
+    Keys always include the username, so answers never cross users.
+    """
+
+    def __init__(self, ttl: float = RESPONSE_CACHE_TTL, max_size: int = RESPONSE_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[Tuple[str, str, str], Tuple[float, str, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, username: str, question: str, fingerprint: str) -> Optional[Tuple[str, str]]:
+        """
+        Look up a cached answer.
+
+        Args:
+            username (str): The user asking.
+            question (str): The user's question.
+            fingerprint (str): Context fingerprint from context_fingerprint().
+        Returns:
+            Optional[Tuple[str, str]]: (answer, topic), or None on a miss or expired entry.
+        """
+        key = (username, normalize_question(question), fingerprint)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, answer, topic = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return answer, topic
+
+    def put(self, username: str, question: str, fingerprint: str, answer: str, topic: str) -> None:
+        """
+        Store an answer, evicting the least recently used entry when full.
+
+        Args:
+            username (str): The user asking.
+            question (str): The user's question.
+            fingerprint (str): Context fingerprint from context_fingerprint().
+            answer (str): The final answer returned to the user.
+            topic (str): The topic the interaction was saved under.
+        """
+        key = (username, normalize_question(question), fingerprint)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, answer, topic)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached answer."""
+        with self._lock:
+            self._entries.clear()
+
+# Global instance
+response_cache = ResponseCache()
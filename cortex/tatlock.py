@@ -5,21 +5,22 @@ Core agent logic for Tatlock implementing Multi-phase prompt architecture.
 Handles chat interaction, tool dispatch, and butler personality.
 """
 
-import ollama
 import json
 import re
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import date, datetime
 import uuid
-import asyncio
 import inspect
 from typing import List, Literal
 import instructor
 from openai import OpenAI
 from pydantic import BaseModel, Field
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Mapping
 import re
 
 # Import from our new, organized modules
@@ -31,7 +32,10 @@ from hippocampus.remember import save_interaction
 from hippocampus.conversation_compact import trigger_compact_if_needed, get_conversation_context
 from hippocampus.user_database import ensure_user_database
 from cortex.response_parser import response_parser, response_formatter
+from cortex.response_cache import response_cache, context_fingerprint
 from stem.debug_logger import get_debug_logger, reset_debug_logger
+from stem.ollama_client import get_ollama_client, cached_chat
+from stem.jsonutils import parse_json, dump_json
 
 # Set up logging for this module
 logger = logging.getLogger(__name__)
@@ -42,6 +46,134 @@ print("MODULE RELOAD: cortex.tatlock module loaded with debug functionality")
 # --- Tool Dispatcher ---
 # AVAILABLE_TOOLS now provided by dynamic tool system in stem/tools.py
 
+# Tools that operate on per-user memory and need the username injected
+_MEMORY_TOOLS = frozenset({
+    'recall_memories', 'recall_memories_with_time', 'find_personal_variables',
+    'get_conversations_by_topic', 'get_topics_by_conversation', 'get_conversation_summary',
+    'get_topic_statistics', 'get_user_conversations', 'get_conversation_details', 'search_conversations'
+})
+
+# Upper bound on tool calls executed in parallel within one phase
+_MAX_TOOL_WORKERS = 4
+
+def _tool_call_key(function_name: str, function_args: dict) -> tuple[str, str]:
+    """Build a hashable key identifying a tool call by name and canonical arguments."""
+    return function_name, dump_json(function_args, sort_keys=True, default=str)
+
+def _run_tool_call(function_name: str, function_args: dict) -> tuple:
+    """
+    Execute a single tool call, capturing its duration and any exception.
+
+    Args:
+        function_name (str): Name of the tool to execute
+        function_args (dict): Keyword arguments for the tool
+
+    Returns:
+        tuple: (output dict or None, duration in seconds, exception or None)
+    """
+    tool_start = time.time()
+    try:
+        output = execute_tool(function_name, **function_args)
+    except Exception as e:
+        return None, time.time() - tool_start, e
+    return output, time.time() - tool_start, None
+
+def _prepare_tool_call(function_name: str, function_args: Any, username: str) -> tuple[str, dict]:
+    """
+    Normalize a requested tool call's arguments and scope memory tools to the user.
+
+    Args:
+        function_name (str): Name of the requested tool
+        function_args (Any): Arguments as sent by the model, a dict or JSON string
+        username (str): User whose memory the tool may access
+
+    Returns:
+        tuple: (function name, argument dict ready for execution)
+    """
+    # Ensure arguments is a dict
+    if isinstance(function_args, str):
+        try:
+            function_args = parse_json(function_args)
+        except json.JSONDecodeError:
+            function_args = {}
+    # Valid JSON that is not an object (a list, string or number) carries no
+    # keyword arguments; the call then fails on its own instead of the phase
+    if not isinstance(function_args, Mapping):
+        if function_args:
+            logger.warning(f"Ignoring non-object arguments for tool {function_name}")
+        function_args = {}
+    function_args = dict(function_args)
+
+    # Add username to memory-related tools
+    if function_name in _MEMORY_TOOLS:
+        function_args['username'] = username
+
+    return function_name, function_args
+
+def _collect_chat_stream(stream: Any, on_tool_call: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+    """
+    Assemble a streamed chat response, handing each native tool call to
+    on_tool_call as soon as the chunk carrying it arrives.
+
+    Args:
+        stream (Any): Chunks from a chat call made with stream=True
+        on_tool_call (Callable): Called with each tool call dict
+
+    Returns:
+        Dict[str, Any]: Response shaped like a non-streamed chat response
+    """
+    # A client that does not stream hands back the complete response
+    if isinstance(stream, Mapping):
+        return stream
+
+    content_parts = []
+    tool_calls = []
+    last_chunk = {}
+    for chunk in stream:
+        # Chunks are read in place; only tool calls, which are few, are dumped
+        message = chunk.get('message') or {}
+        if message.get('content'):
+            content_parts.append(message['content'])
+        for tool_call in message.get('tool_calls') or ():
+            if hasattr(tool_call, 'model_dump'):
+                tool_call = tool_call.model_dump(exclude_none=True)
+            tool_calls.append(tool_call)
+            on_tool_call(tool_call)
+        last_chunk = chunk
+
+    if hasattr(last_chunk, 'model_dump'):
+        last_chunk = last_chunk.model_dump(exclude_none=True)
+
+    message = {'role': 'assistant', 'content': ''.join(content_parts)}
+    if tool_calls:
+        message['tool_calls'] = tool_calls
+    return {**last_chunk, 'message': message}
+
+@lru_cache(maxsize=8)
+def _system_messages(base_instructions: tuple[str, ...], label: str = '') -> tuple[Dict[str, str], ...]:
+    """
+    Wrap base instructions into system messages, each prefixed with label,
+    reusing the result while the instructions are unchanged. The returned dicts are shared and must not be mutated.
+    """
+    return tuple(
+        {'role': 'system', 'content': f'{label}{instruction}'}
+        for instruction in base_instructions
+    )
+
+# Identity and temporal questions that always take the capability guard path
+_IDENTITY_QUESTION_RE = re.compile(r"\bwhat'?s your name\b|\bwho are you\b|\byour name\b")
+_TEMPORAL_QUESTION_RE = re.compile(r"\bwhat time is it\b|\bcurrent time\b|\bwhat'?s the date\b|\btoday'?s date\b")
+# Questions that are nothing but an identity or temporal question; only these
+# are routed to the guard without an assessment call
+_IDENTITY_ONLY_RE = re.compile(r"^\s*(?:what(?:'?s| is) your name|who are you)\W*$", re.IGNORECASE)
+_TEMPORAL_ONLY_RE = re.compile(
+    r"^\s*(?:what time is it|what(?:'?s| is) the (?:time|date)|what(?:'?s| is) today'?s date)\W*$",
+    re.IGNORECASE
+)
+
+# Start of the apology returned when a phase fails before the model produced an answer
+_PROCESSING_FAILURE_PREFIX = "I apologize, sir, but I encountered an issue"
+
 # === NEW Multi-PHASE ARCHITECTURE CLASSES ===
 
 class PromptPhase(Enum):
@@ -127,6 +259,7 @@ class ProcessingContext(BaseModel):
     tool_execution_results: List[Dict[str, Any]] = Field(default_factory=list)
     formatted_response: Optional[str] = None
     compact_summary: Optional[str] = None  # Compacted conversation summary if available
+    tool_cache: Dict[Any, Dict[str, Any]] = Field(default_factory=dict)  # Tool outputs (successful or failed) for this question, keyed by _tool_call_key
 
 
 # Initialize instructor client for structured output
@@ -138,6 +271,37 @@ instructor_client = instructor.from_openai(
     mode=instructor.Mode.JSON,
 )
 
+# === PROMPT TEMPLATES ===
+# Static prompt text is defined once at import; builders only fill in the
+# per-turn parts
+
+_CAPABILITY_GUARD_PROMPT = """[SYSTEM: CAPABILITY_GUARD] If the question asks about sensitive topics that require full context, respond with "CAPABILITY_GUARD: [REASON]" where REASON is:
+- IDENTITY: Questions about your name, identity, or who you are
+- CAPABILITIES: Questions about what you can do, your functions, or abilities
+- TEMPORAL: Questions about current time, date, or temporal context
+- SECURITY: Questions about personal data, credentials, or sensitive information
+- MIXED: Questions combining multiple sensitive topics
+
+[SYSTEM: TOOLS_AVAILABLE] You have access to tools in these categories:
+• PERSONAL DATA: {personal_data}
+• MEMORY/RECALL: {memory_recall}
+• EXTERNAL DATA: {external_data}
+• VISUAL ANALYSIS: {visual_analysis}
+• CONVERSATION ANALYSIS: {conversation_analysis}"""
+
+_ASSESSMENT_INSTRUCTIONS = """Can you answer this question directly with your existing knowledge, or do you need tools?
+Respond with: DIRECT, TOOLS_NEEDED, or CAPABILITY_GUARD: [REASON]
+If DIRECT, provide your complete answer.
+If TOOLS_NEEDED, describe what tools you think you need."""
+
+_BUTLER_ROLE_PROMPT = """[SYSTEM: BUTLER_ROLE] You are Tatlock, a British butler. Format a response according to these requirements:
+- Keep responses concise (under 50 words) unless specified otherwise
+- Use proper British butler speech
+- Always end with ", sir."
+- Be helpful but formal
+- Remove any technical jargon
+- Synthesize information naturally"""
+
 # === PROMPT BUILDER CLASS ===
 
 class PromptBuilder:
@@ -154,34 +318,25 @@ class PromptBuilder:
             "Responses that don't maintain butler persona",
             "Technical jargon or system information leaked to user"
         ]
+        # The patterns never change, so the prompt section is built once
+        self.edge_case_list = '\n'.join(f"- {pattern}" for pattern in self.edge_case_patterns)
 
     def build_assessment_prompt(self, context: ProcessingContext, tool_categories: Dict[str, List[str]]) -> List[Dict[str, str]]:
         """Build Phase 1 assessment prompt with CAPABILITY_GUARD"""
 
-        capability_guard_prompt = f"""[SYSTEM: CAPABILITY_GUARD] If the question asks about sensitive topics that require full context, respond with "CAPABILITY_GUARD: [REASON]" where REASON is:
-- IDENTITY: Questions about your name, identity, or who you are
-- CAPABILITIES: Questions about what you can do, your functions, or abilities
-- TEMPORAL: Questions about current time, date, or temporal context
-- SECURITY: Questions about personal data, credentials, or sensitive information
-- MIXED: Questions combining multiple sensitive topics
-
-[SYSTEM: TOOLS_AVAILABLE] You have access to tools in these categories:
-• PERSONAL DATA: {tool_categories.get('personal_data', [])}
-• MEMORY/RECALL: {tool_categories.get('memory_recall', [])}
-• EXTERNAL DATA: {tool_categories.get('external_data', [])}
-• VISUAL ANALYSIS: {tool_categories.get('visual_analysis', [])}
-• CONVERSATION ANALYSIS: {tool_categories.get('conversation_analysis', [])}
-
-[QUESTION] {context.original_question}
-
-Can you answer this question directly with your existing knowledge, or do you need tools?
-Respond with: DIRECT, TOOLS_NEEDED, or CAPABILITY_GUARD: [REASON]
-If DIRECT, provide your complete answer.
-If TOOLS_NEEDED, describe what tools you think you need."""
+        capability_guard_prompt = _CAPABILITY_GUARD_PROMPT.format(
+            personal_data=tool_categories.get('personal_data', []),
+            memory_recall=tool_categories.get('memory_recall', []),
+            external_data=tool_categories.get('external_data', []),
+            visual_analysis=tool_categories.get('visual_analysis', []),
+            conversation_analysis=tool_categories.get('conversation_analysis', [])
+        )
+        question_prompt = f"[QUESTION] {context.original_question}\n\n{_ASSESSMENT_INSTRUCTIONS}"
 
+        # Static instructions lead so the model server can reuse the cached
+        # prompt prefix; the conversation, which only grows between turns, comes
+        # next, and the per-turn date, location and question go last
         messages = [
-            {'role': 'system', 'content': f'[SYSTEM: DATE] {context.date_time}'},
-            {'role': 'system', 'content': f'[SYSTEM: LOCATION] User location: {context.location}'},
             {'role': 'system', 'content': capability_guard_prompt}
         ]
 
@@ -199,7 +354,12 @@ If TOOLS_NEEDED, describe what tools you think you need."""
             history_to_add = context.history if context.compact_summary else context.history[-3:]
             messages.extend(history_to_add)
 
-        messages.append({"role": "user", "content": context.original_question})
+        messages.extend([
+            {'role': 'system', 'content': f'[SYSTEM: DATE] {context.date_time}'},
+            {'role': 'system', 'content': f'[SYSTEM: LOCATION] User location: {context.location}'},
+            {'role': 'system', 'content': question_prompt},
+            {"role": "user", "content": context.original_question}
+        ])
 
         return messages
 
@@ -215,16 +375,16 @@ If TOOLS_NEEDED, describe what tools you think you need."""
 
         tools_text = '\n'.join(tool_descriptions)
 
-        selection_prompt = f"""[SYSTEM: DATE] {context.date_time}
+        selection_prompt = f"""[SYSTEM: AVAILABLE_TOOLS] Here are the specific tools available:
+{tools_text}
+
+[SYSTEM: DATE] {context.date_time}
 [SYSTEM: LOCATION] User location: {context.location}
 
 [QUESTION] {context.original_question}
 
 [BACKGROUND: TOOL_QUERY] {context.assessment_result.tool_query}
 
-[SYSTEM: AVAILABLE_TOOLS] Here are the specific tools available:
-{tools_text}
-
 Select only the tools needed and provide usage instructions:"""
 
         messages = [
@@ -238,16 +398,12 @@ Select only the tools needed and provide usage instructions:"""
 
         if is_capability_guard:
             # Use full rise_and_shine context for capability guard scenarios
-            messages = [
-                {'role': 'system', 'content': f'[SYSTEM: DATE] {context.date_time}'},
-                {'role': 'system', 'content': f'[SYSTEM: LOCATION] User location: {context.location}'}
-            ]
-
-            # Add all base instructions (rise_and_shine)
-            for instruction in context.base_instructions:
-                messages.append({'role': 'system', 'content': f'[SYSTEM: RISE_AND_SHINE] {instruction}'})
+            # Add all base instructions (rise_and_shine) ahead of the per-turn date
+            messages = list(_system_messages(tuple(context.base_instructions), '[SYSTEM: RISE_AND_SHINE] '))
 
             messages.extend([
+                {'role': 'system', 'content': f'[SYSTEM: DATE] {context.date_time}'},
+                {'role': 'system', 'content': f'[SYSTEM: LOCATION] User location: {context.location}'},
                 {'role': 'system', 'content': '[SYSTEM: FORMATTING_REQUIREMENTS] Answer the original question directly using your identity from the rise_and_shine instructions above.'},
                 {'role': 'system', 'content': f'[QUESTION] {context.original_question}'},
                 {'role': 'system', 'content': f'[BACKGROUND: CAPABILITY_GUARD_TRIGGERED] True'},
@@ -263,35 +419,26 @@ Select only the tools needed and provide usage instructions:"""
                 background_sections.append(f'[BACKGROUND: TOOL_SELECTION_PHASE] {context.assessment_result.tool_query}')
 
             if context.tool_execution_results:
-                background_sections.append('[BACKGROUND: TOOL_EXECUTION]')
-                for result in context.tool_execution_results:
-                    background_sections.append(f"Called {result.get('tool_name', 'unknown')} with results: {result.get('status', 'unknown')}")
-
-            if context.tool_execution_results:
-                background_sections.append('[BACKGROUND: TOOL_RESULTS]')
-                results_summary = []
+                # Both sections are collected in one pass over the results and
+                # joined once below
+                execution_lines = ['[BACKGROUND: TOOL_EXECUTION]']
+                results_summary = ['[BACKGROUND: TOOL_RESULTS]']
                 for result in context.tool_execution_results:
-                    if result.get('status') == 'success':
+                    status = result.get('status', 'unknown')
+                    execution_lines.append(f"Called {result.get('tool_name', 'unknown')} with results: {status}")
+                    if status == 'success':
                         results_summary.append(f"{result.get('tool_name', 'tool')}: {str(result.get('data', 'No data'))[:100]}")
                     else:
                         results_summary.append(f"{result.get('tool_name', 'tool')}: {result.get('message', 'Failed')}")
+                background_sections.extend(execution_lines)
                 background_sections.extend(results_summary)
 
             background_text = '\n'.join(background_sections) if background_sections else 'Direct answer path, no tools used'
 
-            butler_prompt = f"""[SYSTEM: BUTLER_ROLE] You are Tatlock, a British butler. Format a response according to these requirements:
-- Keep responses concise (under 50 words) unless specified otherwise
-- Use proper British butler speech
-- Always end with ", sir."
-- Be helpful but formal
-- Remove any technical jargon
-- Synthesize information naturally
-
-[QUESTION] {context.original_question}
-
-{background_text}
-
-Provide the properly formatted butler response:"""
+            butler_prompt = (
+                f"{_BUTLER_ROLE_PROMPT}\n\n[QUESTION] {context.original_question}\n\n"
+                f"{background_text}\n\nProvide the properly formatted butler response:"
+            )
 
             messages = [
                 {'role': 'system', 'content': butler_prompt}
@@ -302,8 +449,6 @@ Provide the properly formatted butler response:"""
     def build_quality_gate_prompt(self, context: ProcessingContext, proposed_response: str) -> List[Dict[str, str]]:
         """Build Phase Multi quality gate prompt"""
 
-        edge_case_list = '\n'.join([f"- {pattern}" for pattern in self.edge_case_patterns])
-
         context_summary = []
         if context.assessment_result:
             if context.assessment_result.assessment_type == "CAPABILITY_GUARD":
@@ -318,7 +463,7 @@ Provide the properly formatted butler response:"""
         quality_prompt = f"""[SYSTEM: QUALITY_GATE] Review this response against known issues:
 
 EDGE CASE PATTERNS:
-{edge_case_list}
+{self.edge_case_list}
 
 EDGE CASE CHECKS:
 - Does this answer the original question completely?
@@ -356,6 +501,7 @@ class QualityGate:
             "SAFETY_VIOLATION": "I'm not able to help with that request, sir.",
             "UNKNOWN": "I apologize, sir, but I encountered an issue processing your request. Please try again."
         }
+        self._canned_responses = frozenset(response for response in self.fallback_responses.values() if response)
 
     def evaluate_response(self, context: ProcessingContext, proposed_response: str) -> QualityResult:
         """Evaluate if proposed answer adequately addresses the original question"""
@@ -375,7 +521,23 @@ class QualityGate:
         if edge_case_result.needs_fallback:
             return edge_case_result
 
-        # Step 4: Use LLM for final quality assessment
+        # Step 4: Canned fallback text comes from us, not the model; skip the
+        # LLM round-trip since there is nothing model-generated to review
+        if proposed_response.startswith(_PROCESSING_FAILURE_PREFIX) or proposed_response in self._canned_responses:
+            return QualityResult(approved=True, response=proposed_response, reasoning="Canned fallback response, LLM check skipped")
+
+        # An empty reply cannot be approved or corrected usefully, so it goes
+        # straight to the fallback instead of paying for another model call
+        if not proposed_response.strip():
+            return QualityResult(
+                approved=False,
+                needs_fallback=True,
+                fallback_type="INCOMPLETE",
+                response=self.fallback_responses["INCOMPLETE"],
+                reasoning="Empty response, LLM check skipped"
+            )
+
+        # Step 5: Use LLM for final quality assessment
         llm_result = self._llm_quality_check(context, proposed_response)
         return llm_result
 
@@ -495,7 +657,8 @@ class QualityGate:
             messages = self.prompt_builder.build_quality_gate_prompt(context, proposed_response)
 
             # Get LLM evaluation
-            quality_response = ollama.chat(model=OLLAMA_MODEL, messages=messages, tools=[])
+            # Judging is deterministic, so identical reviews reuse the earlier verdict
+            quality_response = cached_chat(get_ollama_client(), model=OLLAMA_MODEL, messages=messages, tools=[], options={"temperature": 0})
             quality_content = quality_response['message']['content']
 
             # Parse quality response
@@ -626,19 +789,51 @@ class TatlockProcessor:
         """Process question through Multi-phase architecture"""
 
         start_time = time.time()
-        logger.info(f"[TIERED LLM ARCHITECTURE] Processing: '{user_message[:50]}...'")
+        logger.debug(f"[TIERED LLM ARCHITECTURE] Processing: '{user_message[:50]}...'")
 
         # Initialize debug logger
         debug_logger = get_debug_logger(conversation_id)
-        debug_logger.log_phase_start("NEW Multi-Phase Processing", f"User: {username}, Message: {user_message[:100]}")
+        if debug_logger.enabled:
+            debug_logger.log_phase_start("NEW Multi-Phase Processing", f"User: {username}, Message: {user_message[:100]}")
 
         # Build processing context
         context = self._build_context(user_message, history, username, conversation_id)
 
+        # New conversations get their id once, so the saved interaction, the
+        # compaction thread and the response all refer to the same conversation
+        if not conversation_id:
+            conversation_id = context.conversation_id = uuid.uuid4().hex
+
+        # A question already answered directly in the same context is answered
+        # from the cache, skipping every model call; it is still saved so the
+        # conversation history stays complete. The time of day is left out of
+        # the key so answers can be reused within the TTL
+        cache_fingerprint = context_fingerprint(
+            context.history, context.compact_summary,
+            context.date_time.split(' at ')[0], context.location
+        )
+        cached = response_cache.get(username, user_message, cache_fingerprint)
+        if cached is not None:
+            final_response, topic_str = cached
+            logger.info("Answered from response cache")
+            self._save_and_compact(user_message, final_response, topic_str, username, conversation_id)
+
+            return {
+                "response": final_response,
+                "topic": topic_str,
+                "history": self._final_history(context, final_response),
+                "conversation_id": conversation_id,
+                "processing_time": round(time.time() - start_time, 1)
+            }
+
         try:
             phase1_t0 = time.time()
-            # Phase 1: Initial Assessment
-            assessment_result = self._phase_1_assessment(context, debug_logger)
+            # Phase 1: Initial Assessment, skipped when the rules below settle it
+            assessment_result = self._rule_based_assessment(context.original_question)
+            if assessment_result is None:
+                assessment_result = self._phase_1_assessment(context, debug_logger)
+            else:
+                logger.info(f"Assessment decided by rules: guard {assessment_result.guard_reason.value}")
             logger.info(f"Phase 1 duration: {round(time.time()-phase1_t0,2)}s")
             context.assessment_result = assessment_result
             context.current_phase = PromptPhase.INITIAL_ASSESSMENT
@@ -668,28 +863,14 @@ class TatlockProcessor:
                 final_response = quality_result.response
                 processing_time = round(time.time() - start_time, 1)
 
-                # Save interaction asynchronously, but do not block
-                try:
-                    topic_str = self._determine_topic(assessment_result)
-                    save_interaction(
-                        user_prompt=user_message,
-                        llm_reply=final_response,
-                        full_llm_history=[],
-                        topic=topic_str,
-                        username=username,
-                        conversation_id=conversation_id
-                    )
-                    db_path = ensure_user_database(username)
-                    import threading
-                    threading.Thread(target=trigger_compact_if_needed, args=(username, conversation_id, db_path), daemon=True).start()
-                except Exception as e:
-                    logger.error(f"Error saving interaction (guard path): {e}")
+                topic_str = self._determine_topic(assessment_result)
+                self._save_and_compact(user_message, final_response, topic_str, username, conversation_id)
 
                 return {
                     "response": final_response,
                     "topic": topic_str,
-                    "history": context.history + [{"role": "assistant", "content": final_response}],
-                    "conversation_id": conversation_id or datetime.now().strftime('%Y-%m-%d-%H-%M-%S'),
+                    "history": self._final_history(context, final_response),
+                    "conversation_id": conversation_id,
                     "processing_time": processing_time
                 }
 
@@ -709,28 +890,21 @@ class TatlockProcessor:
                 final_response = quality_result.response
                 processing_time = round(time.time() - start_time, 1)
 
-                # Save asynchronously
-                try:
-                    topic_str = self._determine_topic(assessment_result)
-                    save_interaction(
-                        user_prompt=user_message,
-                        llm_reply=final_response,
-                        full_llm_history=[],
-                        topic=topic_str,
-                        username=username,
-                        conversation_id=conversation_id
-                    )
-                    db_path = ensure_user_database(username)
-                    import threading
-                    threading.Thread(target=trigger_compact_if_needed, args=(username, conversation_id, db_path), daemon=True).start()
-                except Exception as e:
-                    logger.error(f"Error saving interaction (direct path): {e}")
+                topic_str = self._determine_topic(assessment_result)
+                self._save_and_compact(user_message, final_response, topic_str, username, conversation_id)
+
+                # Direct answers depend only on the question, conversation, date
+                # and location, all part of the cache key, so they can be reused;
+                # fallbacks and apologies for failed phases are not
+                if (quality_result.approved and not quality_result.needs_fallback
+                        and not final_response.startswith(_PROCESSING_FAILURE_PREFIX)):
+                    response_cache.put(username, user_message, cache_fingerprint, final_response, topic_str)
 
                 return {
                     "response": final_response,
                     "topic": topic_str,
-                    "history": context.history + [{"role": "assistant", "content": final_response}],
-                    "conversation_id": conversation_id or datetime.now().strftime('%Y-%m-%d-%H-%M-%S'),
+                    "history": self._final_history(context, final_response),
+                    "conversation_id": conversation_id,
                     "processing_time": processing_time
                 }
 
@@ -770,41 +944,14 @@ class TatlockProcessor:
             final_response = quality_result.response
             processing_time = round(time.time() - start_time, 1)
 
-            # Save interaction (non-blocking compacting)
-            try:
-                topic_str = self._determine_topic(assessment_result)
-                save_interaction(
-                    user_prompt=user_message,
-                    llm_reply=final_response,
-                    full_llm_history=[],  # Empty - we now use database context loading
-                    topic=topic_str,
-                    username=username,
-                    conversation_id=conversation_id
-                )
-
-                # Trigger automatic compacting if threshold reached (every 25 messages)
-                # Run in background and do NOT block the response path
-                db_path = ensure_user_database(username)
-                import threading
-                compact_thread = threading.Thread(
-                    target=trigger_compact_if_needed,
-                    args=(username, conversation_id, db_path),
-                    daemon=True
-                )
-                compact_thread.start()
-                # Do not join: avoid blocking response on compacting
-                logger.debug("Compacting thread started (non-blocking)")
-            except Exception as e:
-                logger.error(f"Error saving interaction: {e}")
-
-            # Build final history for response
-            final_history = context.history + [{"role": "assistant", "content": final_response}]
+            topic_str = self._determine_topic(assessment_result)
+            self._save_and_compact(user_message, final_response, topic_str, username, conversation_id)
 
             return {
                 "response": final_response,
                 "topic": topic_str,
-                "history": final_history,
-                "conversation_id": conversation_id or datetime.now().strftime('%Y-%m-%d-%H-%M-%S'),
+                "history": self._final_history(context, final_response),
+                "conversation_id": conversation_id,
                 "processing_time": processing_time
             }
 
@@ -816,29 +963,103 @@ class TatlockProcessor:
             return {
                 "response": fallback_response,
                 "topic": "error_fallback",
-                "history": context.history + [{"role": "assistant", "content": fallback_response}],
-                "conversation_id": conversation_id or datetime.now().strftime('%Y-%m-%d-%H-%M-%S'),
+                "history": self._final_history(context, fallback_response),
+                "conversation_id": conversation_id,
                 "processing_time": processing_time
             }
 
+    def _save_and_compact(self, user_message: str, reply: str, topic: str, username: str, conversation_id: str) -> None:
+        """
+        Save the interaction and start compacting in the background if due.
+        Failures are logged rather than raised, so the reply is still returned.
+
+        Args:
+            user_message (str): The user's question.
+            reply (str): The final reply returned to the user.
+            topic (str): Topic to file the interaction under.
+            username (str): The user whose database to write.
+            conversation_id (str): The conversation the interaction belongs to.
+        """
+        try:
+            save_interaction(
+                user_prompt=user_message,
+                llm_reply=reply,
+                full_llm_history=[],  # Empty - we now use database context loading
+                topic=topic,
+                username=username,
+                conversation_id=conversation_id
+            )
+
+            # Trigger automatic compacting if threshold reached; run in the
+            # background so the response is not blocked on compacting
+            db_path = ensure_user_database(username)
+            threading.Thread(
+                target=trigger_compact_if_needed,
+                args=(username, conversation_id, db_path),
+                daemon=True
+            ).start()
+            logger.debug("Compacting thread started (non-blocking)")
+        except Exception as e:
+            logger.error(f"Error saving interaction: {e}")
+
+    def _final_history(self, context: ProcessingContext, reply: str) -> List[Dict[str, Any]]:
+        """
+        Append the assistant reply to the context history and return it.
+
+        The context owns its history list (pydantic copies it on validation) and is
+        discarded after the response, so the list is extended in place rather than
+        copied into a new one.
+        """
+        context.history.append({"role": "assistant", "content": reply})
+        return context.history
+
     def _detect_guard_reason(self, question: str) -> Optional[CapabilityGuardReason]:
         """Lightweight regex-based guard detection for identity/temporal."""
         q = (question or "").lower()
-        if re.search(r"\bwhat'?s your name\b|\bwho are you\b|\byour name\b", q):
+        if _IDENTITY_QUESTION_RE.search(q):
             return CapabilityGuardReason.IDENTITY
-        if re.search(r"\bwhat time is it\b|\bcurrent time\b|\bwhat'?s the date\b|\btoday'?s date\b", q):
+        if _TEMPORAL_QUESTION_RE.search(q):
             return CapabilityGuardReason.TEMPORAL
         return None
 
-    
+    def _rule_based_assessment(self, question: str) -> Optional[AssessmentResult]:
+        """
+        Settle the assessment without the LLM when the outcome is already known.
+
+        A question that is nothing but "what's your name?" or "what time is it?"
+        always ends on the CAPABILITY_GUARD path, and that path needs nothing
+        from the assessment call but the reason. Anything longer, such as the
+        time in another city or who the user is meeting, may need tools and
+        still goes to the model.
+
+        Args:
+            question (str): The user's question.
+
+        Returns:
+            Optional[AssessmentResult]: A guard assessment, or None to ask the model.
+        """
+        if _IDENTITY_ONLY_RE.match(question):
+            guard_reason = CapabilityGuardReason.IDENTITY
+        elif _TEMPORAL_ONLY_RE.match(question):
+            guard_reason = CapabilityGuardReason.TEMPORAL
+        else:
+            return None
+        return AssessmentResult(assessment_type="CAPABILITY_GUARD", guard_reason=guard_reason)
 
     def _build_context(self, user_message: str, history: List[Dict], username: str, conversation_id: str) -> ProcessingContext:
         """Build initial processing context with compacted conversation awareness"""
 
         # Get user location
         location = "unknown location"
+        tool_cache = {}
         try:
-            location_result = execute_tool("find_personal_variables", searchkey="location", username=username)
+            location_args = {"searchkey": "location", "username": username}
+            # Looked up on every request, as nothing signals when the user
+            # changes their location. Phase 3 reuses this if the model asks for
+            # the location again, including a failed lookup, which would only
+            # fail again
+            location_result = execute_tool("find_personal_variables", **location_args)
+            tool_cache[_tool_call_key("find_personal_variables", location_args)] = location_result
             if location_result.get("status") == "success" and location_result.get("data"):
                 location = location_result["data"][0]["value"]
         except Exception as e:
@@ -856,13 +1077,9 @@ class TatlockProcessor:
                 db_path = ensure_user_database(username)
 
                 # Get conversation context (uses smart query based on message count)
-                compact_summary, recent_messages = get_conversation_context(username, conversation_id, db_path)
-
-                # Always use database context when conversation_id exists
-                context_history = [
-                    {"role": msg["role"], "content": msg["content"]}
-                    for msg in recent_messages
-                ]
+                # Always use database context when conversation_id exists; the
+                # messages already come back in chat format
+                compact_summary, context_history = get_conversation_context(username, conversation_id, db_path)
 
                 if compact_summary:
                     logger.info(f"Loaded compacted context: {len(context_history)} recent messages + compact summary")
@@ -887,7 +1104,8 @@ class TatlockProcessor:
             base_instructions=base_instructions,
             history=context_history,
             current_phase=PromptPhase.INITIAL_ASSESSMENT,
-            compact_summary=compact_summary  # Add compact summary to context
+            compact_summary=compact_summary,  # Add compact summary to context
+            tool_cache=tool_cache
         )
 
     def _phase_1_assessment(self, context: ProcessingContext, debug_logger) -> AssessmentResult:
@@ -907,7 +1125,7 @@ class TatlockProcessor:
         try:
             # Call LLM for assessment
             phase1_start = time.time()
-            response = ollama.chat(model=OLLAMA_MODEL, messages=messages, tools=[], options={"timeout": 20000})
+            response = get_ollama_client().chat(model=OLLAMA_MODEL, messages=messages, tools=[], options={"timeout": 20000})
             phase1_end = time.time()
 
             response_content = response['message']['content']
@@ -933,7 +1151,8 @@ class TatlockProcessor:
     def _phase_2_tool_selection(self, context: ProcessingContext, debug_logger) -> ToolSelectionResult:
         """Phase 2: Tool Selection"""
 
-        debug_logger.log_phase_start("Phase 2: Tool Selection", f"Selecting tools for: {context.assessment_result.tool_query}")
+        if debug_logger.enabled:
+            debug_logger.log_phase_start("Phase 2: Tool Selection", f"Selecting tools for: {context.assessment_result.tool_query}")
 
         # Get available tools based on assessment
         requested_tools = context.assessment_result.tools_needed
@@ -947,7 +1166,7 @@ class TatlockProcessor:
 
         try:
             phase2_start = time.time()
-            response = ollama.chat(model=OLLAMA_MODEL, messages=messages, tools=[], options={"timeout": 20000})
+            response = get_ollama_client().chat(model=OLLAMA_MODEL, messages=messages, tools=[], options={"timeout": 20000})
             phase2_end = time.time()
 
             response_content = response['message']['content']
@@ -974,19 +1193,18 @@ class TatlockProcessor:
     def _phase_3_tool_execution(self, context: ProcessingContext, debug_logger) -> List[Dict[str, Any]]:
         """Phase 3: Tool Execution"""
 
-        debug_logger.log_phase_start("Phase 3: Tool Execution", f"Executing: {context.tool_selection_result.selected_tools}")
+        if debug_logger.enabled:
+            debug_logger.log_phase_start("Phase 3: Tool Execution", f"Executing: {context.tool_selection_result.selected_tools}")
 
         # Get tools and execute LLM call with tools
         selected_tools = get_selected_tools(context.tool_selection_result.selected_tools)
 
         # Build messages for tool execution
-        messages = []
-        messages.append({'role': 'system', 'content': f'The current date is {context.date_time}. The user is in {context.location}.'})
-
-        for instruction in context.base_instructions:
-            messages.append({'role': 'system', 'content': instruction})
-
+        # Base instructions first so they form a stable prompt prefix across turns;
+        # the date changes every minute, so it follows the conversation
+        messages = list(_system_messages(tuple(context.base_instructions)))
         messages.extend(context.history)
+        messages.append({'role': 'system', 'content': f'The current date is {context.date_time}. The user is in {context.location}.'})
         messages.append({"role": "user", "content": context.original_question})
         messages.append({'role': 'system', 'content': f'Use the provided tools as needed to answer the user\'s question. {context.tool_selection_result.usage_instructions}'})
 
@@ -994,44 +1212,89 @@ class TatlockProcessor:
         debug_logger.log_llm_request(OLLAMA_MODEL, messages, tools=selected_tools, iteration_type="tool_execution")
 
         try:
-            phase3_start = time.time()
-            response = ollama.chat(model=OLLAMA_MODEL, messages=messages, tools=selected_tools)
-            phase3_end = time.time()
-
-            # Debug log the response
-            debug_logger.log_llm_response(response, phase3_end - phase3_start)
-
-            # Parse and execute tool calls (reuse existing logic)
-            parsed_response = response_parser.parse_response(response)
-            tool_results = []
-
-            if parsed_response.needs_tool_execution and parsed_response.tool_calls:
-                for tool_call in parsed_response.tool_calls:
-                    function_name = tool_call.name
-                    function_args = tool_call.arguments
-
-                    # Ensure arguments is a dict
-                    if isinstance(function_args, str):
-                        try:
-                            function_args = json.loads(function_args)
-                        except json.JSONDecodeError:
-                            function_args = {}
-
-                    logger.info(f"Executing tool: {function_name} with args: {function_args}")
-
-                    # Add username to memory-related tools
-                    if function_name in ['recall_memories', 'recall_memories_with_time', 'find_personal_variables',
-                                       'get_conversations_by_topic', 'get_topics_by_conversation', 'get_conversation_summary',
-                                       'get_topic_statistics', 'get_user_conversations', 'get_conversation_details', 'search_conversations']:
-                        function_args['username'] = context.username
-
+            with ThreadPoolExecutor(max_workers=_MAX_TOOL_WORKERS) as executor:
+                # Native tool calls start running while the rest of the reply is
+                # still streaming in; the dispatch below picks up their futures
+                prefetched = {}
+
+                def start_tool_call(tool_call: Dict[str, Any]) -> None:
+                    # Prefetching is only an optimization: a call that cannot be
+                    # prepared here is left to the dispatch below
                     try:
-                        tool_start = time.time()
-                        output = execute_tool(function_name, **function_args)
-                        tool_end = time.time()
+                        function = tool_call.get('function') or {}
+                        call = _prepare_tool_call(function.get('name', ''), function.get('arguments'), context.username)
+                        call_key = _tool_call_key(*call)
+                    except Exception as e:
+                        logger.warning(f"Not prefetching tool call: {e}")
+                        return
+                    if call_key not in prefetched and call_key not in context.tool_cache:
+                        prefetched[call_key] = executor.submit(_run_tool_call, *call)
+
+                phase3_start = time.time()
+                stream = get_ollama_client().chat(model=OLLAMA_MODEL, messages=messages, tools=selected_tools, stream=True)
+                response = _collect_chat_stream(stream, start_tool_call)
+                phase3_end = time.time()
+
+                # Debug log the response
+                debug_logger.log_llm_response(response, phase3_end - phase3_start)
+
+                # Parse and execute tool calls (reuse existing logic)
+                parsed_response = response_parser.parse_response(response)
+                tool_results = []
+
+                if parsed_response.needs_tool_execution and parsed_response.tool_calls:
+                    calls = []
+                    for tool_call in parsed_response.tool_calls:
+                        function_name, function_args = _prepare_tool_call(tool_call.name, tool_call.arguments, context.username)
+                        # Arguments can carry user text; keep them out of INFO logs
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Executing tool: {function_name} with args: {function_args}")
+                        calls.append((function_name, function_args))
+
+                    # Identical calls (same tool and arguments) in one response run once
+                    call_keys = [_tool_call_key(*call) for call in calls]
+                    unique_calls = dict(zip(call_keys, calls))
+
+                    # Calls already answered while handling this question reuse that
+                    # output; a failed answer is reported again rather than retried
+                    outcomes_by_key = {
+                        call_key: (context.tool_cache[call_key], 0.0, None)
+                        for call_key in unique_calls if call_key in context.tool_cache
+                    }
+                    pending_calls = {
+                        call_key: call for call_key, call in unique_calls.items()
+                        if call_key not in outcomes_by_key
+                    }
+
+                    # Tool calls are independent of each other, so the remaining
+                    # ones run concurrently; results keep the order the model
+                    # requested them in
+                    futures = [
+                        prefetched.get(call_key) or executor.submit(_run_tool_call, *call)
+                        for call_key, call in pending_calls.items()
+                    ]
+
+                    for call_key, future in zip(pending_calls, futures):
+                        outcome = future.result()
+                        outcomes_by_key[call_key] = outcome
+                        output, _, error = outcome
+                        if error is None:
+                            context.tool_cache[call_key] = output
+
+                    for (function_name, function_args), call_key in zip(calls, call_keys):
+                        output, duration, error = outcomes_by_key[call_key]
+                        if error is not None:
+                            logger.error(f"Tool execution failed for {function_name}: {error}")
+                            tool_results.append({
+                                "tool_name": function_name,
+                                "status": "error",
+                                "data": None,
+                                "message": f"Tool execution failed: {str(error)}"
+                            })
+                            continue
 
                         # Debug log tool execution
-                        debug_logger.log_tool_execution(function_name, function_args, output, tool_end - tool_start)
+                        debug_logger.log_tool_execution(function_name, function_args, output, duration)
 
                         tool_results.append({
                             "tool_name": function_name,
@@ -1040,15 +1303,6 @@ class TatlockProcessor:
                             "message": output.get("message", "")
                         })
 
-                    except Exception as e:
-                        logger.error(f"Tool execution failed for {function_name}: {e}")
-                        tool_results.append({
-                            "tool_name": function_name,
-                            "status": "error",
-                            "data": None,
-                            "message": f"Tool execution failed: {str(e)}"
-                        })
-
             return tool_results
 
         except Exception as e:
@@ -1074,7 +1328,7 @@ class TatlockProcessor:
 
         try:
             phase4_start = time.time()
-            response = ollama.chat(model=OLLAMA_MODEL, messages=messages, tools=[])
+            response = get_ollama_client().chat(model=OLLAMA_MODEL, messages=messages, tools=[])
             phase4_end = time.time()
 
             formatted_response = response['message']['content'].strip()
@@ -1094,7 +1348,7 @@ class TatlockProcessor:
     def _phase_5_quality_gate(self, context: ProcessingContext, debug_logger) -> QualityResult:
         """Phase Multi: Quality Gate"""
 
-        debug_logger.log_phase_start("Phase Multi: Quality Gate", f"Validating response quality")
+        debug_logger.log_phase_start("Phase Multi: Quality Gate", "Validating response quality")
 
         quality_result = self.quality_gate.evaluate_response(context, context.formatted_response)
 
@@ -1119,22 +1373,6 @@ class TatlockProcessor:
             return "general_conversation"
 
 
-def run_async(coro):
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = None
-    if loop and loop.is_running():
-        try:
-            import nest_asyncio
-            nest_asyncio.apply()
-        except ImportError:
-            raise RuntimeError("nest_asyncio is required to run async tools in a running event loop. Please install it with 'pip install nest_asyncio'.")
-        return loop.run_until_complete(coro)
-    else:
-        return asyncio.run(coro)
-
-
 # === NEW PROCESSOR INTEGRATION ===
 
 # Global processor instance
@@ -17,16 +17,20 @@ import uuid
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 import logging
-import ollama
 
 from config import OLLAMA_MODEL
 from hippocampus.recall import get_conversation_messages
+from stem.ollama_client import get_ollama_client, cached_chat
 
 logger = logging.getLogger(__name__)
 
 # Compact every N messages (50 = 25 interactions of user+assistant pairs)
 COMPACT_INTERVAL = 50
 
+# Message ranges with less text than this are compacted verbatim instead of
+# through the LLM; a transcript this short is no longer than a summary would be
+TRIVIAL_COMPACT_CHARS = 2000
+
 
 def _build_conservative_compact_prompt(messages: List[Dict], conversation_id: str) -> str:
     """
@@ -93,6 +97,90 @@ Remember: CONSERVATIVE means preserving MORE detail, not less. When in doubt, in
     return prompt
 
 
+def _build_verbatim_compact(messages: List[Dict], topics: List[str]) -> str:
+    """
+    Build a compact summary for short message ranges without calling the LLM.
+
+    The messages are kept word for word in the same structure the LLM is asked
+    to produce, so nothing is lost and topic extraction keeps working.
+
+    Args:
+        messages: Messages in the range, oldest first
+        topics: Topic names recorded for the range; "General conversation" if empty
+    """
+    timeline = []
+    for idx, msg in enumerate(messages, 1):
+        content = (msg.get('content') or '').strip() or '[empty]'
+        timeline.append(f"{idx}. {msg.get('role', 'unknown').capitalize()} ({msg.get('timestamp', 'unknown')}): {content}")
+
+    topic_lines = "\n".join(f"- {topic}" for topic in topics or ["General conversation"])
+    return f"TOPICS DISCUSSED:\n{topic_lines}\n\nFACTUAL TIMELINE:\n" + "\n".join(timeline)
+
+
+def _range_topics(cursor: sqlite3.Cursor, conversation_id: str, messages: List[Dict]) -> List[str]:
+    """
+    Get the topics saved for the interactions in a message range.
+
+    save_interaction stores each interaction's memory row with the same timestamp
+    as its messages, so the range's interactions are found by timestamp.
+
+    Args:
+        cursor: Cursor on the user's database
+        conversation_id: Conversation the messages belong to
+        messages: Messages in the range, oldest first
+
+    Returns:
+        Topic names in order of first occurrence
+    """
+    cursor.execute("""
+        SELECT t.topic_name
+        FROM memories m
+        JOIN memory_topics mt ON mt.interaction_id = m.interaction_id
+        JOIN topics t ON t.topic_id = mt.topic_id
+        WHERE m.conversation_id = ? AND m.timestamp BETWEEN ? AND ?
+        GROUP BY t.topic_name
+        ORDER BY MIN(m.timestamp)
+    """, (conversation_id, messages[0]['timestamp'], messages[-1]['timestamp']))
+    return [row[0] for row in cursor.fetchall()]
+
+
+def _summarize_with_llm(messages: List[Dict], conversation_id: str) -> Optional[str]:
+    """
+    Summarize a message range with the LLM using the conservative compact prompt.
+
+    Returns:
+        The summary text, or None if the call failed or returned nothing
+    """
+    prompt = _build_conservative_compact_prompt(messages, conversation_id)
+
+    # Call LLM for summarization using ollama library
+    try:
+        logger.info(f"Calling LLM for summarization: model={OLLAMA_MODEL}, message_count={len(messages)}")
+
+        # Use the shared ollama client with a response length limit. Summaries
+        # are sampled deterministically, so a retried window reuses the result
+        response = cached_chat(
+            get_ollama_client(),
+            model=OLLAMA_MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            options={"num_predict": 2000, "temperature": 0}  # Limit response length to ensure faster completion
+        )
+
+        logger.info(f"LLM call completed, processing response...")
+        compact_summary = response.get('message', {}).get('content', '')
+
+        if not compact_summary:
+            logger.error(f"Empty summary returned from LLM for conversation {conversation_id}")
+            return None
+
+        logger.info(f"LLM summarization succeeded: summary_length={len(compact_summary)}")
+        return compact_summary
+
+    except Exception as e:
+        logger.error(f"LLM summarization failed for conversation {conversation_id}: {e}", exc_info=True)
+        return None
+
+
 def create_conversation_compact(
     username: str,
     conversation_id: str,
@@ -143,62 +231,46 @@ def create_conversation_compact(
         last_compact = cursor.fetchone()
         start_from = last_compact[0] + 1 if last_compact else 1
 
-        # Get messages to compact from conversation_messages table
+        # Get only the messages in this compact's range from conversation_messages;
+        # earlier ranges are already summarized and need not be read again
         cursor.execute("""
             SELECT role, content, timestamp
             FROM conversation_messages
             WHERE conversation_id = ?
             ORDER BY message_number ASC
-        """, (conversation_id,))
-
-        all_messages = cursor.fetchall()
+            LIMIT ? OFFSET ?
+        """, (conversation_id, COMPACT_INTERVAL, start_from - 1))
 
-        logger.info(f"Compact creation: conversation_id={conversation_id}, start_from={start_from}, total_messages={len(all_messages)}, COMPACT_INTERVAL={COMPACT_INTERVAL}")
+        logger.info(f"Compact creation: conversation_id={conversation_id}, start_from={start_from}, total_messages={total_messages}, COMPACT_INTERVAL={COMPACT_INTERVAL}")
 
-        # Convert to list of dicts and slice to get messages for this compact
+        # Convert to list of dicts for this compact
         messages_to_compact = [
             {
                 'role': msg[0],
                 'content': msg[1],
                 'timestamp': msg[2]
             }
-            for idx, msg in enumerate(all_messages, 1)
-            if start_from <= idx < start_from + COMPACT_INTERVAL
+            for msg in cursor.fetchall()
         ]
 
         if not messages_to_compact:
-            logger.warning(f"No messages to compact for conversation {conversation_id}: start_from={start_from}, total_messages={len(all_messages)}, COMPACT_INTERVAL={COMPACT_INTERVAL}")
+            logger.warning(f"No messages to compact for conversation {conversation_id}: start_from={start_from}, total_messages={total_messages}, COMPACT_INTERVAL={COMPACT_INTERVAL}")
             conn.close()
             return None
 
         messages_up_to = start_from + len(messages_to_compact) - 1
 
-        # Build conservative prompt
-        prompt = _build_conservative_compact_prompt(messages_to_compact, conversation_id)
-
-        # Call LLM for summarization using ollama library
-        try:
-            logger.info(f"Calling LLM for summarization: model={OLLAMA_MODEL}, message_count={len(messages_to_compact)}")
-
-            # Use ollama with timeout via options
-            response = ollama.chat(
-                model=OLLAMA_MODEL,
-                messages=[{"role": "user", "content": prompt}],
-                options={"num_predict": 2000}  # Limit response length to ensure faster completion
+        # Short or mostly empty ranges are stored verbatim, skipping the LLM round-trip
+        content_chars = sum(len(msg['content'] or '') for msg in messages_to_compact)
+        if content_chars < TRIVIAL_COMPACT_CHARS:
+            logger.info(f"Compacting {len(messages_to_compact)} messages verbatim ({content_chars} chars), skipping LLM summarization")
+            compact_summary = _build_verbatim_compact(
+                messages_to_compact, _range_topics(cursor, conversation_id, messages_to_compact)
             )
+        else:
+            compact_summary = _summarize_with_llm(messages_to_compact, conversation_id)
 
-            logger.info(f"LLM call completed, processing response...")
-            compact_summary = response.get('message', {}).get('content', '')
-
-            if not compact_summary:
-                logger.error(f"Empty summary returned from LLM for conversation {conversation_id}")
-                conn.close()
-                return None
-
-            logger.info(f"LLM summarization succeeded: summary_length={len(compact_summary)}")
-
-        except Exception as e:
-            logger.error(f"LLM summarization failed for conversation {conversation_id}: {e}", exc_info=True)
+        if compact_summary is None:
             conn.close()
             return None
 
@@ -267,6 +339,7 @@ def get_conversation_context(
     Returns:
         Tuple of (compact_summary_text, list_of_recent_messages)
         compact_summary_text is None if no compact exists yet
+        Messages are {'role', 'content'} dicts ready for the chat API
     """
     try:
         conn = sqlite3.connect(db_path)
@@ -300,22 +373,16 @@ def get_conversation_context(
 
             # Load messages AFTER the last compact boundary
             cursor.execute("""
-                SELECT role, content, timestamp
+                SELECT role, content
                 FROM conversation_messages
                 WHERE conversation_id = ? AND message_number > ?
                 ORDER BY message_number ASC
             """, (conversation_id, last_compact_boundary))
 
-            uncompacted_rows = cursor.fetchall()
-
-            # Convert to list of dicts
+            # Built in chat message shape so callers can use them as-is
             uncompacted_messages = [
-                {
-                    'role': msg[0],
-                    'content': msg[1],
-                    'timestamp': msg[2]
-                }
-                for msg in uncompacted_rows
+                {'role': role, 'content': content}
+                for role, content in cursor.fetchall()
             ]
 
             conn.close()
@@ -324,20 +391,15 @@ def get_conversation_context(
             # Less than COMPACT_INTERVAL messages, no compact exists
             # Get all messages
             cursor.execute("""
-                SELECT role, content, timestamp
+                SELECT role, content
                 FROM conversation_messages
                 WHERE conversation_id = ?
                 ORDER BY message_number ASC
             """, (conversation_id,))
 
-            all_messages = cursor.fetchall()
             recent_messages = [
-                {
-                    'role': msg[0],
-                    'content': msg[1],
-                    'timestamp': msg[2]
-                }
-                for msg in all_messages
+                {'role': role, 'content': content}
+                for role, content in cursor.fetchall()
             ]
 
             conn.close()
@@ -7,7 +7,21 @@ Now supports user-specific databases.
 
 import sqlite3
 import os
+from datetime import datetime
 from hippocampus.user_database import execute_user_query, get_database_connection
+from stem.ttlcache import TTLMemo
+
+# Core tools whose prompts are always loaded for immediate access
+CORE_TOOLS = (
+    'recall_memories',
+    'recall_memories_with_time',
+    'find_personal_variables',
+    'get_temporal_info'
+)
+
+# Seconds the system prompts are reused before the system database is read
+# again, so edits made outside this process are picked up without a restart
+SYSTEM_PROMPTS_TTL = 60.0
 
 
 def get_base_instructions(username: str = "") -> list[str]:
@@ -18,11 +32,31 @@ def get_base_instructions(username: str = "") -> list[str]:
     NOT from user databases. The system prompts include base instructions from rise_and_shine
     plus dynamic prompts from enabled tools in the tools table.
     
+    The database prompts are cached for SYSTEM_PROMPTS_TTL seconds; call
+    clear_base_instructions_cache() after changing them. Only the timestamp
+    prompt is rebuilt on every call.
+    
     Args:
         username (str): The username (not used, kept for compatibility).
     Returns:
         list[str]: Complete system instructions including base prompts and enabled tool prompts.
     """
+    # Add current timestamp for temporal context
+    now = datetime.now()
+    timestamp_prompt = f"Current date and time: {now.strftime('%A, %B %d, %Y at %I:%M %p')}"
+
+    # Combine base prompts with core tool prompts and timestamp
+    # This reduces overhead from 27 prompts to ~8 prompts (4 base + 3 core tools + timestamp)
+    return [*_system_prompts.get(), timestamp_prompt]
+
+
+def _load_system_prompts() -> tuple[str, ...]:
+    """
+    Load the enabled rise_and_shine prompts followed by the core tool prompts.
+    
+    Returns:
+        tuple[str, ...]: Base prompts and core tool prompts, in prompt order.
+    """
     # Read from system database instead of user database
     system_db_path = "hippocampus/system.db"
     if not os.path.exists(system_db_path):
@@ -44,14 +78,6 @@ def get_base_instructions(username: str = "") -> list[str]:
     # Core tools (always available): memory, personal data
     # Extended tools (catalog-based): weather, web search, screenshots, etc.
 
-    # Define core tools that should always be immediately accessible
-    CORE_TOOLS = [
-        'recall_memories',
-        'recall_memories_with_time',
-        'find_personal_variables',
-        'get_temporal_info'
-    ]
-
     # Get core tool prompts (always loaded for immediate access)
     placeholders = ','.join(['?' for _ in CORE_TOOLS])
     cursor.execute(f"""
@@ -64,16 +90,16 @@ def get_base_instructions(username: str = "") -> list[str]:
 
     conn.close()
 
-    # Add current timestamp for temporal context
-    from datetime import datetime
-    now = datetime.now()
-    timestamp_prompt = f"Current date and time: {now.strftime('%A, %B %d, %Y at %I:%M %p')}"
+    return tuple(base_prompts + core_tool_prompts)
+
+
+# Resolved at call time so tests can patch the loader
+_system_prompts = TTLMemo(lambda: _load_system_prompts(), SYSTEM_PROMPTS_TTL)
 
-    # Combine base prompts with core tool prompts and timestamp
-    # This reduces overhead from 27 prompts to ~8 prompts (4 base + 3 core tools + timestamp)
-    all_prompts = base_prompts + core_tool_prompts + [timestamp_prompt]
 
-    return all_prompts
+def clear_base_instructions_cache() -> None:
+    """Drop the cached system prompts so the next call reads the system database."""
+    _system_prompts.clear()
 
 
 def query_personal_variables(searchkey: str, username: str = "") -> list[dict]:
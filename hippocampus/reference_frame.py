@@ -8,12 +8,16 @@ for the agent's capabilities at any given time.
 import sqlite3
 import logging
 import os
+from stem.ttlcache import TTLMemo
 
 logger = logging.getLogger(__name__)
 
 # The system database path should be consistent
 SYSTEM_DB_PATH = "hippocampus/system.db"
 
+# Seconds the tool catalog is reused before the system database is read again
+TOOL_CATALOG_TTL = 60.0
+
 def get_system_db_connection() -> sqlite3.Connection | None:
     """Establishes a connection to the system database."""
     try:
@@ -92,6 +96,24 @@ def get_tool_catalog_for_selection() -> dict:
     """
     Get a simplified tool catalog organized by category for LLM tool selection.
     Returns tools grouped by functionality with brief descriptions.
+
+    The catalog is cached for TOOL_CATALOG_TTL seconds; call
+    clear_tool_catalog_cache() after enabling or disabling tools. The returned
+    dict is shared and must not be mutated.
+    """
+    return _tool_catalog.get()
+
+def clear_tool_catalog_cache() -> None:
+    """Drop the cached tool catalog and definitions so the next call reads the system database."""
+    _tool_catalog.clear()
+    _tool_definitions.clear()
+
+def _load_tool_catalog() -> dict:
+    """
+    Read the enabled tools from the system database and group them by category.
+
+    Returns:
+        dict: Category name to list of {"key", "desc"} entries, or {} on error.
     """
     conn = get_system_db_connection()
     if not conn:
@@ -140,62 +162,26 @@ def get_selected_tools(tool_keys: list[str]) -> list[dict]:
     """
     Get full tool definitions for specified tool keys only.
     This is used for the second phase after LLM selects which tools it needs.
-    """
-    conn = get_system_db_connection()
-    if not conn:
-        return []
 
-    tools_list = []
-    try:
-        cursor = conn.cursor()
-
-        # Create placeholders for the IN clause
-        placeholders = ','.join('?' for _ in tool_keys)
-        query = f"SELECT tool_key, description FROM tools WHERE enabled = 1 AND tool_key IN ({placeholders})"
-
-        cursor.execute(query, tool_keys)
-        selected_tools = cursor.fetchall()
-
-        for tool_row in selected_tools:
-            tool_key = tool_row['tool_key']
-
-            # Fetch parameters for this specific tool
-            cursor.execute(
-                "SELECT name, type, description, is_required FROM tool_parameters WHERE tool_key = ?",
-                (tool_key,)
-            )
-            params = cursor.fetchall()
-
-            properties = {}
-            required = []
-            for param_row in params:
-                properties[param_row['name']] = {
-                    "type": param_row['type'],
-                    "description": param_row['description']
-                }
-                if param_row['is_required'] == 1:
-                    required.append(param_row['name'])
+    Definitions come from the same TTL cache as the tool catalog, so choosing
+    tools for a question does not touch the system database. The returned
+    definitions are shared and must not be mutated.
+    """
+    wanted = set(tool_keys)
+    tools_list = [definition for tool_key, definition in _tool_definitions.get().items() if tool_key in wanted]
+    logger.debug(f"Loaded {len(tools_list)} selected tools.")
+    return tools_list
 
-            # Build tool definition
-            tool_definition = {
-                "type": "function",
-                "function": {
-                    "name": tool_key,
-                    "description": tool_row['description'],
-                    "parameters": {
-                        "type": "object",
-                        "properties": properties,
-                        "required": required
-                    }
-                }
-            }
-            tools_list.append(tool_definition)
+def _load_tool_definitions() -> dict[str, dict]:
+    """
+    Get the definitions of all enabled tools keyed by tool key.
 
-    except sqlite3.Error as e:
-        logger.error(f"Database error while fetching selected tools: {e}")
-    finally:
-        if conn:
-            conn.close()
+    Returns:
+        dict[str, dict]: Tool key to tool definition, in database order.
+    """
+    return {tool['function']['name']: tool for tool in get_enabled_tools_from_db()}
 
-    logger.debug(f"Loaded {len(tools_list)} selected tools from database.")
-    return tools_list 
\ No newline at end of file
+# Failed reads return empty results, which are not cached so the next request
+# tries again. Loaders are resolved at call time so tests can patch them
+_tool_catalog = TTLMemo(lambda: _load_tool_catalog(), TOOL_CATALOG_TTL, cache_empty=False)
+_tool_definitions = TTLMemo(lambda: _load_tool_definitions(), TOOL_CATALOG_TTL, cache_empty=False)
@@ -6,7 +6,6 @@ Now supports user-specific databases and conversation IDs.
 """
 
 import sqlite3
-import json
 import logging
 from datetime import datetime
 import uuid
@@ -15,6 +14,7 @@ from typing import Optional
 from hippocampus.user_database import get_database_connection, ensure_user_database, execute_user_query
 from config import SYSTEM_DB_PATH
 from stem.models import UserModel
+from stem.jsonutils import dump_json
 
 # Set up logging for this module
 logger = logging.getLogger(__name__)
@@ -53,7 +53,7 @@ def save_interaction(user_prompt: str, llm_reply: str, full_llm_history: list[di
         full_llm_history (list[dict]): Full conversation history.
         topic (str): The topic name.
         username (str): The username whose database to use.
-        conversation_id (str | None): Conversation ID for grouping. If None, generates from current time.
+        conversation_id (str | None): Conversation ID for grouping. If None, a random ID is generated.
     Returns:
         str | None: The interaction ID, or None on error.
     """
@@ -62,10 +62,7 @@ def save_interaction(user_prompt: str, llm_reply: str, full_llm_history: list[di
     
     # Generate conversation_id if not provided
     if conversation_id is None:
-        conversation_id = datetime.now().strftime('%Y-%m-%d-%H-%M-%S')
-    
-    # Create or update conversation record
-    create_or_update_conversation(conversation_id, username, title=f"Conversation about {topic}")
+        conversation_id = uuid.uuid4().hex
 
     conn = None
 
@@ -88,26 +85,25 @@ def save_interaction(user_prompt: str, llm_reply: str, full_llm_history: list[di
         # BEGIN TRANSACTION
         cursor.execute("BEGIN")
 
-        # Step 1: Save messages to conversation_messages table
-        # Insert user message
-        user_message_id = f"{interaction_id}_user"
-        cursor.execute("""
-            INSERT INTO conversation_messages
-            (message_id, conversation_id, message_number, role, content, timestamp)
-            VALUES (?, ?, ?, 'user', ?, ?)
-        """, (user_message_id, conversation_id, user_message_num, user_prompt, timestamp))
+        # Create or update the conversation record in the same transaction, so
+        # one turn costs a single connection and commit
+        _upsert_conversation(cursor, conversation_id, f"Conversation about {topic}")
 
-        # Insert assistant message
-        assistant_message_id = f"{interaction_id}_assistant"
-        cursor.execute("""
+        # Step 1: Save both messages to conversation_messages table in one statement
+        cursor.executemany("""
             INSERT INTO conversation_messages
             (message_id, conversation_id, message_number, role, content, timestamp)
-            VALUES (?, ?, ?, 'assistant', ?, ?)
-        """, (assistant_message_id, conversation_id, assistant_message_num, llm_reply, timestamp))
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, [
+            (f"{interaction_id}_user", conversation_id, user_message_num, 'user', user_prompt, timestamp),
+            (f"{interaction_id}_assistant", conversation_id, assistant_message_num, 'assistant', llm_reply, timestamp)
+        ])
 
         # Step 2: Save to memories table for backward compatibility with tools
         # (This provides interaction-level granularity for analytics tools)
-        history_json = json.dumps(full_llm_history, indent=2)
+        # Messages are already stored one row each above; callers now usually pass
+        # an empty history, so the blob is only serialized when there is one
+        history_json = dump_json(full_llm_history) if full_llm_history else "[]"
         cursor.execute("""
             INSERT INTO memories (interaction_id, conversation_id, timestamp, user_prompt, llm_reply, full_conversation_history)
             VALUES (?, ?, ?, ?, ?, ?)
@@ -152,35 +148,41 @@ def update_conversation_topics(conn: sqlite3.Connection, conversation_id: str, t
     """
     cursor = conn.cursor()
     try:
-        # Check if this conversation-topic relationship already exists
+        # Insert the relationship, or bump its count and last occurrence if it exists
         cursor.execute("""
-            SELECT first_occurrence, last_occurrence, topic_count
-            FROM conversation_topics 
-            WHERE conversation_id = ? AND topic_id = ?
-        """, (conversation_id, topic_id))
-        
-        existing = cursor.fetchone()
-        
-        if existing:
-            # Update existing relationship
-            first_occurrence, last_occurrence, count = existing
-            cursor.execute("""
-                UPDATE conversation_topics 
-                SET last_occurrence = ?, topic_count = topic_count + 1
-                WHERE conversation_id = ? AND topic_id = ?
-            """, (timestamp, conversation_id, topic_id))
-        else:
-            # Create new relationship
-            cursor.execute("""
-                INSERT INTO conversation_topics (conversation_id, topic_id, first_occurrence, last_occurrence, topic_count)
-                VALUES (?, ?, ?, ?, 1)
-            """, (conversation_id, topic_id, timestamp, timestamp))
-            
+            INSERT INTO conversation_topics (conversation_id, topic_id, first_occurrence, last_occurrence, topic_count)
+            VALUES (?, ?, ?, ?, 1)
+            ON CONFLICT (conversation_id, topic_id) DO UPDATE SET
+                last_occurrence = excluded.last_occurrence,
+                topic_count = topic_count + 1
+        """, (conversation_id, topic_id, timestamp, timestamp))
+
     except sqlite3.Error as e:
         logger.error(f"Error updating conversation_topics: {e}")
         raise
 
 
+def _upsert_conversation(cursor: sqlite3.Cursor, conversation_id: str, title: str | None) -> None:
+    """
+    Insert or refresh a conversation row, counting one user/assistant exchange.
+    Args:
+        cursor (sqlite3.Cursor): Cursor on the user's longterm database.
+        conversation_id (str): The conversation ID.
+        title (str | None): Conversation title.
+    """
+    # Update the existing row in place: REPLACE would delete and re-insert it,
+    # resetting every column not listed here to its default
+    cursor.execute("""
+        INSERT INTO conversations
+        (conversation_id, title, started_at, last_activity, message_count)
+        VALUES (?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 2)
+        ON CONFLICT (conversation_id) DO UPDATE SET
+            title = excluded.title,
+            last_activity = excluded.last_activity,
+            message_count = message_count + 2
+    """, (conversation_id, title))
+
+
 def create_or_update_conversation(conversation_id: str, username: str, title: str | None = None) -> bool:
     """
     Create or update a conversation record in the user's longterm database.
@@ -196,14 +198,9 @@ def create_or_update_conversation(conversation_id: str, username: str, title: st
         db_path = ensure_user_database(username)
         conn = sqlite3.connect(db_path)
         cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT OR REPLACE INTO conversations
-            (conversation_id, title, started_at, last_activity, message_count)
-            VALUES (?, ?, COALESCE((SELECT started_at FROM conversations WHERE conversation_id = ?), CURRENT_TIMESTAMP), CURRENT_TIMESTAMP,
-                   COALESCE((SELECT message_count FROM conversations WHERE conversation_id = ?), 0) + 2)
-        """, (conversation_id, title, conversation_id, conversation_id))
-        
+
+        _upsert_conversation(cursor, conversation_id, title)
+
         conn.commit()
         conn.close()
         
@@ -1343,6 +1343,13 @@ fi
 
 echo "- system.db is ready in the hippocampus/ directory. User memory databases will be created automatically when users are added."
 
+# Snapshot the database settings so startup can skip the settings query
+if PYTHONPATH="$PROJECT_ROOT" $PYTHON_CMD -m stem.installation.config_snapshot > /dev/null; then
+    echo "- Resolved settings saved to resolved_config.py"
+else
+    echo "Warning: Could not write resolved_config.py; settings will be resolved at startup."
+fi
+
 # --- Create admin user if not exists ---
 echo -e "${BLUE}[7/10] Admin user setup...${NC}"
 
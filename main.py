@@ -19,12 +19,14 @@ Features:
 """
 
 import os
+import asyncio
 import logging
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Depends, Request, Form, status, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse, JSONResponse
 import uvicorn
 from cortex.tatlock import process_chat_interaction
+from stem.ollama_client import close_ollama_client
 from stem.static import mount_static_files, get_conversation_page, get_profile_page, get_login_page
 from stem.security import get_current_user, require_admin_role, security_manager, login_user, logout_user, current_user, setup_security_middleware
 from stem.middleware import setup_middleware, setup_logging_config, websocket_auth_middleware
@@ -108,7 +110,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down Tatlock application...")
-    # Add any cleanup logic here if needed
+    close_ollama_client()
 
 # --- FastAPI App ---
 app = FastAPI(
@@ -214,8 +216,10 @@ async def chat_endpoint(request: ChatRequest, user: UserModel = Depends(get_curr
         # so we do it manually before passing to the agent.
         history_dicts = [msg.model_dump(exclude_none=True) for msg in request.history]
 
-        # Process the chat interaction
-        result_dict = process_chat_interaction(
+        # Process the chat interaction in a worker thread so the blocking LLM and
+        # tool calls do not stall the event loop for other requests
+        result_dict = await asyncio.to_thread(
+            process_chat_interaction,
             user_message=request.message,
             history=history_dicts,
             username=user.username,
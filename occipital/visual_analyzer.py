@@ -290,7 +290,7 @@ class VisualAnalyzer:
                 else:
                     failed_tests += 1
         
-        html = f"""
+        html_parts = [f"""
         <!DOCTYPE html>
         <html>
         <head>
@@ -341,15 +341,15 @@ class VisualAnalyzer:
                     <p style="font-size: 24px; font-weight: bold; color: #17a2b8;">{new_baselines}</p>
                 </div>
             </div>
-        """
+        """]
         
         for test_name, test_results in regression_results.items():
-            html += f"""
+            html_parts.append(f"""
             <div class="test-section">
                 <div class="test-header">
                     <h2>{test_name.replace('_', ' ').title()}</h2>
                 </div>
-            """
+            """)
             
             for result_name, result in test_results.items():
                 status_class = 'passed' if result.get('passed') else 'failed'
@@ -359,29 +359,29 @@ class VisualAnalyzer:
                     status_class = 'new'
                     status_text = 'NEW BASELINE'
                 
-                html += f"""
+                html_parts.append(f"""
                 <div class="test-result">
                     <h3 class="{status_class}">{result_name.replace('_', ' ').title()} - {status_text}</h3>
-                """
+                """)
                 
                 if result.get('new_baseline'):
-                    html += f"""
+                    html_parts.append(f"""
                     <p>New baseline created: {result['screenshot_path']}</p>
-                    """
+                    """)
                 elif result.get('passed'):
-                    html += f"""
+                    html_parts.append(f"""
                     <p>Similarity: {result.get('similarity', 0):.2%}</p>
                     <p>Mean difference: {result.get('mean_diff', 0):.2f}</p>
-                    """
+                    """)
                 else:
-                    html += f"""
+                    html_parts.append(f"""
                     <p>Similarity: {result.get('similarity', 0):.2%} (threshold: {result.get('threshold', 0):.2%})</p>
                     <p>Mean difference: {result.get('mean_diff', 0):.2f}</p>
                     <p>Max difference: {result.get('max_diff', 0)}</p>
-                    """
+                    """)
                     
                     if result.get('diff_path'):
-                        html += f"""
+                        html_parts.append(f"""
                         <div class="screenshot-comparison">
                             <div class="screenshot">
                                 <h4>Current</h4>
@@ -396,21 +396,21 @@ class VisualAnalyzer:
                                 <img src="{result['diff_path']}" alt="Difference">
                             </div>
                         </div>
-                        """
+                        """)
                 
-                html += "</div>"
+                html_parts.append("</div>")
             
-            html += "</div>"
+            html_parts.append("</div>")
         
-        html += """
+        html_parts.append("""
         </body>
         </html>
-        """
+        """)
         
         # Save report
         report_path = self.comparison_dir / f"regression_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
         with open(report_path, 'w') as f:
-            f.write(html)
+            f.writelines(html_parts)
         
         logger.info(f"Generated regression report: {report_path}")
         return str(report_path)
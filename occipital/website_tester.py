@@ -307,7 +307,7 @@ class WebsiteTester:
         report_path = self.report_dir / report_filename
         
         # Generate HTML report
-        html_content = f"""
+        html_parts = [f"""
         <!DOCTYPE html>
         <html lang="en">
         <head>
@@ -331,14 +331,14 @@ class WebsiteTester:
             <div class="container">
                 <h1>Website Test Report</h1>
                 <div class="timestamp">Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</div>
-        """
+        """]
         
         for test_name, screenshots in results.items():
-            html_content += f"""
+            html_parts.append(f"""
                 <div class="test-section">
                     <div class="test-title">{test_name.replace('_', ' ').title()}</div>
                     <div class="viewport-grid">
-            """
+            """)
             
             viewports = list(self.viewports.keys())
             for i, viewport in enumerate(viewports):
@@ -347,35 +347,35 @@ class WebsiteTester:
                 if screenshot_path and os.path.exists(screenshot_path):
                     # Convert to relative path for HTML
                     relative_path = os.path.relpath(screenshot_path, self.screenshot_dir)
-                    html_content += f"""
+                    html_parts.append(f"""
                         <div class="viewport-item">
                             <div class="viewport-label">{viewport.title()}</div>
                             <img src="{relative_path}" alt="{test_name} - {viewport}">
                             <div style="font-size: 12px; color: #666; margin-top: 5px;">{relative_path}</div>
                         </div>
-                    """
+                    """)
                 else:
-                    html_content += f"""
+                    html_parts.append(f"""
                         <div class="viewport-item">
                             <div class="viewport-label">{viewport.title()}</div>
                             <div style="color: #999; font-style: italic;">Screenshot not available</div>
                         </div>
-                    """
+                    """)
             
-            html_content += """
+            html_parts.append("""
                     </div>
                 </div>
-            """
+            """)
         
-        html_content += """
+        html_parts.append("""
             </div>
         </body>
         </html>
-        """
+        """)
         
         # Write the report
         with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            f.writelines(html_parts)
         
         logger.info(f"Generated test report: {report_path}")
         return str(report_path)
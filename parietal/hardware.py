@@ -9,10 +9,10 @@ import platform
 import psutil
 import subprocess
 import os
-import ollama
 import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime
+from stem.ollama_client import get_ollama_client
 
 # Set up logging for this module
 logger = logging.getLogger(__name__)
@@ -426,7 +426,7 @@ def run_llm_benchmark() -> Dict[str, Any]:
     try:
         # Test 1: Simple response time
         start_time = time.time()
-        response = ollama.chat(
+        response = get_ollama_client().chat(
             model=OLLAMA_MODEL,
             messages=[{"role": "user", "content": "Say 'Hello' and nothing else."}]
         )
@@ -440,7 +440,7 @@ def run_llm_benchmark() -> Dict[str, Any]:
         
         # Test 2: Complex reasoning
         start_time = time.time()
-        response = ollama.chat(
+        response = get_ollama_client().chat(
             model=OLLAMA_MODEL,
             messages=[{"role": "user", "content": "Explain quantum computing in 2 sentences."}]
         )
@@ -455,7 +455,7 @@ def run_llm_benchmark() -> Dict[str, Any]:
         # Test 3: Tool calling (if available)
         try:
             start_time = time.time()
-            response = ollama.chat(
+            response = get_ollama_client().chat(
                 model=OLLAMA_MODEL,
                 messages=[{"role": "user", "content": "What's the weather like today?"}],
                 tools=[{
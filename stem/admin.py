@@ -14,6 +14,10 @@ from fastapi.responses import HTMLResponse
 from stem.security import get_current_user, require_admin_role, security_manager, current_user
 from stem.static import get_admin_page
 from stem.system_settings import system_settings_manager
+from config import clear_settings_cache
+from stem.installation.config_snapshot import refresh_resolved_config
+from hippocampus.database import clear_base_instructions_cache
+from hippocampus.reference_frame import clear_tool_catalog_cache
 from stem.models import (
     CreateUserRequest, UpdateUserRequest, UserResponse, AdminStatsResponse,
     CreateRoleRequest, UpdateRoleRequest, RoleResponse,
@@ -699,6 +703,12 @@ async def update_system_setting(setting_key: str, request: UpdateSystemSettingRe
         if not success:
             raise HTTPException(status_code=500, detail="Failed to update setting")
         
+        # Drop cached lookups so config.<NAME> reads the new value; modules that
+        # imported the setting by name still need a restart to see it
+        clear_settings_cache()
+        # Keep the startup snapshot of database settings in step with the change
+        refresh_resolved_config()
+        
         # Update tool status if API keys were changed
         if setting_key in ['openweather_api_key', 'google_api_key', 'google_cse_id']:
             system_settings_manager.update_tool_status_based_on_api_keys()
@@ -933,6 +943,11 @@ async def update_tool_status(tool_key: str, enabled: bool, _: None = Depends(req
         conn.commit()
         conn.close()
         
+        # Core tool prompts are part of the cached system instructions, and the
+        # tool catalog only lists enabled tools
+        clear_base_instructions_cache()
+        clear_tool_catalog_cache()
+        
         logger.info(f"Tool {tool_key} {'enabled' if enabled else 'disabled'} by admin")
         
         return {"message": f"Tool {tool_key} {'enabled' if enabled else 'disabled'} successfully"}
@@ -32,6 +32,15 @@ class DebugLogger:
         if DEBUG_MODE or _ENV_DEBUG:
             self._initialize_log_file()
 
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether this session writes a debug log. Callers can check this before
+        building expensive descriptions that would otherwise be discarded.
+        """
+        # The log file is only created when DEBUG_MODE is on
+        return self.log_file_path is not None
+
     def _initialize_log_file(self):
         """Initialize the debug log file for this session."""
         try:
@@ -60,7 +69,7 @@ class DebugLogger:
 
     def log_phase_start(self, phase_name: str, description: str = ""):
         """Log the start of a processing phase."""
-        if not (DEBUG_MODE or _ENV_DEBUG) or not self.log_file_path:
+        if not self.enabled:
             return
 
         self.step_counter += 1
@@ -78,7 +87,7 @@ class DebugLogger:
     def log_llm_request(self, model: str, messages: List[Dict], tools: Optional[List] = None,
                        iteration_type: str = "main"):
         """Log an LLM request with full prompt details."""
-        if not (DEBUG_MODE or _ENV_DEBUG) or not self.log_file_path:
+        if not self.enabled:
             return
 
         self.iteration_counter += 1
@@ -118,7 +127,7 @@ class DebugLogger:
     def log_llm_response(self, response: Dict[str, Any], duration_seconds: float,
                         tool_calls_made: Optional[List] = None):
         """Log an LLM response with timing and tool usage details."""
-        if not (DEBUG_MODE or _ENV_DEBUG) or not self.log_file_path:
+        if not self.enabled:
             return
 
         timestamp = datetime.now().isoformat()
@@ -154,7 +163,7 @@ class DebugLogger:
 
     def log_tool_execution(self, tool_name: str, args: Dict, result: Dict, duration_seconds: float):
         """Log individual tool execution details."""
-        if not (DEBUG_MODE or _ENV_DEBUG) or not self.log_file_path:
+        if not self.enabled:
             return
 
         timestamp = datetime.now().isoformat()
@@ -180,7 +189,7 @@ class DebugLogger:
     def log_phase_summary(self, phase_name: str, duration_seconds: float,
                          iterations: int, success: bool, notes: str = ""):
         """Log a summary of a completed phase."""
-        if not (DEBUG_MODE or _ENV_DEBUG) or not self.log_file_path:
+        if not self.enabled:
             return
 
         timestamp = datetime.now().isoformat()
@@ -198,7 +207,7 @@ class DebugLogger:
 
     def log_quality_gate_result(self, approved: bool, reasoning: str, fallback_type: str = None):
         """Log quality gate evaluation results."""
-        if not DEBUG_MODE or not self.log_file_path:
+        if not self.enabled:
             return
 
         timestamp = datetime.now().isoformat()
@@ -214,7 +223,7 @@ class DebugLogger:
 
     def log_session_end(self, total_duration_seconds: float):
         """Log session completion summary."""
-        if not DEBUG_MODE or not self.log_file_path:
+        if not self.enabled:
             return
 
         timestamp = datetime.now().isoformat()
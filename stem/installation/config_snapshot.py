@@ -0,0 +1,91 @@
+"""
+stem/installation/config_snapshot.py
+
+Generates resolved_config.py, a static snapshot of the system.db settings
+config.py would otherwise query on every startup. Environment variables are not
+recorded; config.py still reads them live. Follows the same pre-computation
+approach as hardware_config.py.
+
+Usage:
+    python -m stem.installation.config_snapshot
+"""
+
+import logging
+import os
+import sys
+
+import config
+
+logger = logging.getLogger(__name__)
+
+_HEADER = '''"""
+Resolved Settings for Tatlock
+Generated by stem/installation/config_snapshot.py - do not edit manually.
+Rewritten automatically when a system setting changes through the admin API.
+Contains API keys, so keep it out of version control.
+"""
+
+'''
+
+def write_resolved_config(path: str = config.RESOLVED_CONFIG_PATH) -> str:
+    """
+    Read the prefetched settings from system.db and write them as a Python literal.
+
+    Args:
+        path (str): Destination file. Defaults to resolved_config.py in the project root.
+
+    Returns:
+        str: The path that was written.
+
+    Raises:
+        RuntimeError: If the system database could not be read.
+    """
+    settings = config.fetch_database_settings()
+    if settings is None:
+        raise RuntimeError("could not read settings from the system database")
+
+    body = f"DATABASE_SETTINGS = {settings!r}\n"
+
+    # Write next to the destination and rename, so a concurrent startup never
+    # reads a partial file. Owner-only permissions: the snapshot includes API keys
+    tmp_path = f"{path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(_HEADER + body)
+    os.replace(tmp_path, path)
+
+    logger.info(f"Wrote {len(settings)} resolved settings to {path}")
+    return path
+
+def refresh_resolved_config(path: str = config.RESOLVED_CONFIG_PATH) -> bool:
+    """
+    Rewrite an existing snapshot after a setting changed. Installations without
+    a snapshot are left without one. If the snapshot cannot be rewritten it is
+    removed, since a stale snapshot would override the new value.
+
+    Args:
+        path (str): Snapshot file. Defaults to resolved_config.py in the project root.
+
+    Returns:
+        bool: True if a snapshot was rewritten.
+    """
+    if not os.path.exists(path):
+        return False
+    try:
+        write_resolved_config(path)
+        return True
+    except Exception as e:
+        logger.warning(f"Could not rewrite {path}, removing it: {e}")
+        try:
+            os.remove(path)
+        except OSError as remove_error:
+            logger.error(f"Could not remove stale {path}: {remove_error}")
+        return False
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    try:
+        print(f"Resolved settings saved to {write_resolved_config()}")
+    except Exception as e:
+        print(f"Error: could not write resolved settings snapshot: {e}", file=sys.stderr)
+        sys.exit(1)
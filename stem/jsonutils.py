@@ -7,7 +7,12 @@ Provides safe JSON serialization and deserialization with error handling.
 
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
 
 # Set up logging for this module
 logger = logging.getLogger(__name__)
@@ -38,4 +43,37 @@ def from_json(json_str: str):
         return json.loads(json_str)
     except Exception as e:
         logger.error(f"Error deserializing from JSON: {e}")
-        return None 
\ No newline at end of file
+        return None 
+
+def parse_json(data: str | bytes) -> Any:
+    """
+    Deserialize JSON text or raw bytes, using orjson when it is installed.
+    Unlike from_json, errors are not swallowed.
+    Args:
+        data (str | bytes): The JSON document, e.g. an HTTP response body.
+    Returns:
+        object: The deserialized object.
+    Raises:
+        ValueError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dump_json(obj: Any, sort_keys: bool = False, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Serialize an object to compact JSON text, using orjson when it is installed.
+    Unlike to_json, errors are not swallowed.
+    Args:
+        obj: The object to serialize.
+        sort_keys (bool): Emit object keys in sorted order, for canonical output.
+        default (Callable | None): Fallback for objects JSON cannot represent.
+    Returns:
+        str: Compact JSON string.
+    Raises:
+        TypeError: If the object is not JSON serializable.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS if sort_keys else None
+        return orjson.dumps(obj, default=default, option=option).decode()
+    return json.dumps(obj, separators=(",", ":"), sort_keys=sort_keys, default=default)
@@ -35,8 +35,13 @@ async def request_timing_middleware(request: Request, call_next: Callable) -> No
     """
     start_time = time.perf_counter()
 
-    # Log request start with method and path
-    logger.info(f"[REQUEST] {request.method} {request.url.path} - Request started")
+    # request.url is rebuilt from the ASGI scope on every access, so the path is
+    # only looked up when the messages will actually be emitted
+    log_requests = logger.isEnabledFor(logging.INFO)
+    if log_requests:
+        path = request.url.path
+        # Log request start with method and path
+        logger.info(f"[REQUEST] {request.method} {path} - Request started")
 
     # Process the request
     response = await call_next(request)
@@ -46,14 +51,15 @@ async def request_timing_middleware(request: Request, call_next: Callable) -> No
     response.headers["X-Process-Time"] = f"{process_time:.3f}"
 
     # Log completion with status-based emoji
-    if 200 <= response.status_code < 400:
-        status_emoji = "✅"  # Success
-    elif response.status_code < 500:
-        status_emoji = "⚠️"   # Client error
-    else:
-        status_emoji = "❌"  # Server error
-
-    logger.info(f"{status_emoji} {request.method} {request.url.path} - {response.status_code} - {process_time:.3f}s")
+    if log_requests:
+        if 200 <= response.status_code < 400:
+            status_emoji = "✅"  # Success
+        elif response.status_code < 500:
+            status_emoji = "⚠️"   # Client error
+        else:
+            status_emoji = "❌"  # Server error
+
+        logger.info(f"{status_emoji} {request.method} {path} - {response.status_code} - {process_time:.3f}s")
 
     return response
 
@@ -0,0 +1,95 @@
+"""
+stem/ollama_client.py
+
+Shared Ollama client for Tatlock.
+All chat calls go through one client configured from OLLAMA_HOST, so they share
+a single connection pool and honour the host set in system settings.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any
+import ollama
+from stem.jsonutils import dump_json
+
+# Set up logging for this module
+logger = logging.getLogger(__name__)
+
+# Global client instance, created on first use
+_ollama_client = None
+
+# Responses to deterministic (temperature 0) chat requests, keyed by request digest
+CHAT_CACHE_SIZE = 256
+_chat_cache: OrderedDict = OrderedDict()
+_chat_cache_lock = threading.Lock()
+
+def get_ollama_client() -> ollama.Client:
+    """
+    Get or create the shared Ollama client.
+
+    The client is created lazily so importing this module does not resolve
+    configuration.
+
+    Returns:
+        ollama.Client: Client bound to the configured Ollama host.
+    """
+    global _ollama_client
+    if _ollama_client is None:
+        from config import OLLAMA_HOST
+        _ollama_client = ollama.Client(host=OLLAMA_HOST)
+        logger.info(f"Created Ollama client for {OLLAMA_HOST}")
+    return _ollama_client
+
+def close_ollama_client() -> None:
+    """
+    Close the shared client's HTTP connection pool, if one was created.
+    The next get_ollama_client() call creates a fresh client.
+    """
+    global _ollama_client
+    if _ollama_client is not None:
+        _ollama_client._client.close()
+        _ollama_client = None
+        logger.info("Closed Ollama client")
+
+def cached_chat(client: ollama.Client, **request: Any) -> Any:
+    """
+    Call client.chat, reusing the response to an identical earlier request
+    when sampling is deterministic.
+
+    Only non-streaming requests whose options set temperature to 0 are
+    cached; anything else is passed straight to the client. The client is
+    passed in rather than looked up so callers keep their own
+    get_ollama_client reference.
+
+    Args:
+        client (ollama.Client): Client to send the request with.
+        **request: Keyword arguments for client.chat (model, messages, tools, options, ...).
+
+    Returns:
+        Any: The chat response, shared with other callers on a cache hit.
+    """
+    options = request.get('options') or {}
+    if options.get('temperature') != 0 or request.get('stream'):
+        return client.chat(**request)
+
+    key = hashlib.blake2b(dump_json(request, sort_keys=True, default=str).encode(), digest_size=16).hexdigest()
+    with _chat_cache_lock:
+        response = _chat_cache.get(key)
+        if response is not None:
+            _chat_cache.move_to_end(key)
+            return response
+
+    response = client.chat(**request)
+
+    with _chat_cache_lock:
+        _chat_cache[key] = response
+        while len(_chat_cache) > CHAT_CACHE_SIZE:
+            _chat_cache.popitem(last=False)
+    return response
+
+def clear_chat_cache() -> None:
+    """Drop every cached chat response."""
+    with _chat_cache_lock:
+        _chat_cache.clear()
@@ -57,6 +57,38 @@ class SystemSettingsManager:
             logger.error(f"Error getting setting {setting_key}: {e}")
             return None
     
+    def get_settings(self, setting_keys: List[str]) -> Dict[str, str]:
+        """
+        Get several system setting values in a single query.
+        
+        Args:
+            setting_keys (List[str]): The setting keys to retrieve
+            
+        Returns:
+            Dict[str, str]: Mapping of found keys to their values; keys that do
+            not exist are omitted. Empty on error.
+        """
+        if not setting_keys:
+            return {}
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            placeholders = ", ".join("?" for _ in setting_keys)
+            cursor.execute(
+                f"SELECT setting_key, setting_value FROM system_settings WHERE setting_key IN ({placeholders})",
+                tuple(setting_keys)
+            )
+            
+            results = dict(cursor.fetchall())
+            conn.close()
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error getting settings {setting_keys}: {e}")
+            return {}
+    
     def set_setting(self, setting_key: str, setting_value: str, remove_previous: bool = False) -> bool:
         """
         Set a system setting value.
@@ -6,6 +6,8 @@ Replaces the old static import system with dynamic loading for modular architect
 Supports built-in tools, plugins, and external tool packages.
 """
 
+import asyncio
+import inspect
 import logging
 from typing import Dict, Any, Callable, Optional
 from stem.dynamic_tools import tool_registry, initialize_tool_system, get_tool_function
@@ -57,6 +59,11 @@ def execute_tool(tool_key: str, **kwargs) -> Dict[str, Any]:
         # Note: Tools get username from current_user global variable, not from parameters
         result = tool_func(**kwargs)
 
+        # Async tools are driven to completion here; tool calls run on worker
+        # threads, which have no event loop of their own
+        if inspect.iscoroutine(result):
+            result = asyncio.run(result)
+
         # Ensure result is in the expected format
         if not isinstance(result, dict):
             result = {"status": "success", "data": result}
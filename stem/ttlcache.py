@@ -0,0 +1,51 @@
+"""
+stem/ttlcache.py
+
+Time-limited memoization for values loaded from the system database.
+"""
+
+import time
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class TTLMemo(Generic[T]):
+    """
+    Memoize the result of a zero-argument loader for a fixed number of seconds,
+    so changes made outside this process are picked up without a restart.
+    """
+
+    def __init__(self, loader: Callable[[], T], ttl: float, cache_empty: bool = True):
+        """
+        Args:
+            loader (Callable[[], T]): Loads the value; called again once it expires.
+            ttl (float): Seconds a loaded value is reused.
+            cache_empty (bool): Whether to keep an empty (falsy) result. Loaders
+                that return an empty value on error pass False, so a failed read
+                is retried on the next call.
+        """
+        self.loader = loader
+        self.ttl = ttl
+        self.cache_empty = cache_empty
+        # (loaded_at monotonic time, value) for the last kept load
+        self._entry: Optional[tuple[float, T]] = None
+
+    def get(self) -> T:
+        """
+        Return the memoized value, loading it when missing or expired.
+
+        Returns:
+            T: The loader's result.
+        """
+        now = time.monotonic()
+        if self._entry is None or now - self._entry[0] >= self.ttl:
+            value = self.loader()
+            if not value and not self.cache_empty:
+                return value
+            self._entry = (now, value)
+        return self._entry[1]
+
+    def clear(self) -> None:
+        """Drop the memoized value so the next call loads it again."""
+        self._entry = None
@@ -12,6 +12,31 @@ from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Whole-word temporal references resolved to explicit times in a single pass;
+# the group name identifies the reference whatever its case
+_TEMPORAL_REFERENCE_RE = re.compile(
+    r'\b(?:' + '|'.join(
+        f'(?P<{word}>{word})'
+        for word in ("now", "today", "yesterday", "tomorrow", "morning", "afternoon", "evening", "night", "tonight")
+    ) + r')\b',
+    re.IGNORECASE
+)
+
+# Basic actions, checked in order; the first match wins
+_ACTION_PATTERNS = (
+    ("query", re.compile(r"\b(what|how|when|where|why|tell me|show me)\b")),
+    ("command", re.compile(r"\b(turn|switch|set|start|stop|open|close)\b")),
+    ("reminder", re.compile(r"\b(remind|remember|note|schedule)\b"))
+)
+
+# Time and date entity patterns
+_TIME_ENTITY_PATTERNS = (
+    (re.compile(r'\b\d{1,2}:\d{2}\b', re.IGNORECASE), 'time'),
+    (re.compile(r'\b\d{1,2} (am|pm)\b', re.IGNORECASE), 'time'),
+    (re.compile(r'\b\d{4}-\d{2}-\d{2}\b', re.IGNORECASE), 'date'),
+    (re.compile(r'\b\d{1,2}/\d{1,2}/\d{4}\b', re.IGNORECASE), 'date')
+)
+
 class LanguageProcessor:
     def __init__(self):
         self.temporal_keywords = {
@@ -80,14 +105,8 @@ class LanguageProcessor:
             intent["categories"].append("time")
             
         # Detect basic actions
-        action_patterns = {
-            "query": r"\b(what|how|when|where|why|tell me|show me)\b",
-            "command": r"\b(turn|switch|set|start|stop|open|close)\b",
-            "reminder": r"\b(remind|remember|note|schedule)\b"
-        }
-        
-        for action_type, pattern in action_patterns.items():
-            if re.search(pattern, text_lower):
+        for action_type, pattern in _ACTION_PATTERNS:
+            if pattern.search(text_lower):
                 intent["action"] = action_type
                 break
                 
@@ -98,33 +117,21 @@ class LanguageProcessor:
         """Resolve temporal references in text"""
         now = context.get("current_time", datetime.now())
         
-        # Replace "now" with current time
-        text = re.sub(r'\bnow\b', f"at {now.strftime('%H:%M')}", text, flags=re.IGNORECASE)
-        
-        # Replace "today" with current date
-        text = re.sub(r'\btoday\b', now.strftime('%Y-%m-%d'), text, flags=re.IGNORECASE)
-        
-        # Replace "yesterday" with previous date
-        yesterday = now - timedelta(days=1)
-        text = re.sub(r'\byesterday\b', yesterday.strftime('%Y-%m-%d'), text, flags=re.IGNORECASE)
-        
-        # Replace "tomorrow" with next date
-        tomorrow = now + timedelta(days=1)
-        text = re.sub(r'\btomorrow\b', tomorrow.strftime('%Y-%m-%d'), text, flags=re.IGNORECASE)
-        
-        # Replace time periods
-        time_periods = {
-            r'\bmorning\b': f"between 06:00 and 12:00 on {now.strftime('%Y-%m-%d')}",
-            r'\bafternoon\b': f"between 12:00 and 18:00 on {now.strftime('%Y-%m-%d')}",
-            r'\bevening\b': f"between 18:00 and 22:00 on {now.strftime('%Y-%m-%d')}",
-            r'\bnight\b': f"between 22:00 and 06:00 on {now.strftime('%Y-%m-%d')}",
-            r'\btonight\b': f"between 18:00 and 06:00 on {now.strftime('%Y-%m-%d')}"
+        date = now.strftime('%Y-%m-%d')
+        replacements = {
+            "now": f"at {now.strftime('%H:%M')}",
+            "today": date,
+            "yesterday": (now - timedelta(days=1)).strftime('%Y-%m-%d'),
+            "tomorrow": (now + timedelta(days=1)).strftime('%Y-%m-%d'),
+            "morning": f"between 06:00 and 12:00 on {date}",
+            "afternoon": f"between 12:00 and 18:00 on {date}",
+            "evening": f"between 18:00 and 22:00 on {date}",
+            "night": f"between 22:00 and 06:00 on {date}",
+            "tonight": f"between 18:00 and 06:00 on {date}"
         }
-        
-        for pattern, replacement in time_periods.items():
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-            
-        return text
+
+        # No replacement contains a reference itself, so one pass resolves them all
+        return _TEMPORAL_REFERENCE_RE.sub(lambda match: replacements[match.lastgroup], text)
         
     def has_temporal_references(self, text: str) -> bool:
         """Check if text contains temporal references"""
@@ -136,15 +143,8 @@ class LanguageProcessor:
         entities = []
         
         # Extract time patterns
-        time_patterns = [
-            (r'\b\d{1,2}:\d{2}\b', 'time'),
-            (r'\b\d{1,2} (am|pm)\b', 'time'),
-            (r'\b\d{4}-\d{2}-\d{2}\b', 'date'),
-            (r'\b\d{1,2}/\d{1,2}/\d{4}\b', 'date')
-        ]
-        
-        for pattern, entity_type in time_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern, entity_type in _TIME_ENTITY_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
                 entities.append({
                     "text": match.group(),
@@ -13,6 +13,7 @@ import logging
 from typing import Optional, Callable, Dict, Any
 from .temporal_context import TemporalContext
 from .language_processor import LanguageProcessor
+from stem.jsonutils import parse_json, dump_json
 
 logger = logging.getLogger(__name__)
 
@@ -91,8 +92,7 @@ class VoiceService:
     async def send_response_to_client(self, websocket, response: Dict[str, Any]) -> None:
         """Send response back to client via WebSocket"""
         try:
-            import json
-            await websocket.send(json.dumps(response))
+            await websocket.send(dump_json(response))
         except Exception as e:
             logger.error(f"Failed to send response to client: {e}")
         
@@ -121,11 +121,10 @@ class VoiceService:
                 elif isinstance(message, str):
                     # Handle text messages
                     try:
-                        import json
-                        data = json.loads(message)
+                        data = parse_json(message)
                         if data.get("type") == "text":
                             await self.process_voice_command(data["text"], websocket)
-                    except json.JSONDecodeError:
+                    except ValueError:
                         # Treat as plain text
                         await self.process_voice_command(message, websocket)
                         
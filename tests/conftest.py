@@ -20,6 +20,9 @@ from main import app
 from stem.security import SecurityManager
 from stem.installation.database_setup import create_system_db_tables, create_longterm_db_tables
 from hippocampus.user_database import get_user_database_path, delete_user_database
+from cortex.response_cache import response_cache
+from stem.ollama_client import clear_chat_cache
+from hippocampus.reference_frame import clear_tool_catalog_cache
 
 
 def cleanup_user_data(username: str):
@@ -80,7 +83,10 @@ def cleanup_after_test():
     
     # This will be called after each test
     # Individual tests can use cleanup_user_data() if they create specific users
-    pass
+    # Answers cached by one test must not short-circuit the next
+    response_cache.clear()
+    clear_chat_cache()
+    clear_tool_catalog_cache()
 
 
 @pytest.fixture(scope="session")
@@ -203,8 +209,10 @@ def authenticated_user_client(client, test_user):
 @pytest.fixture(autouse=True)
 def mock_ollama():
     """Mock Ollama calls to avoid external dependencies in tests."""
-    with patch('cortex.tatlock.ollama') as mock_tatlock, \
-         patch('hippocampus.conversation_compact.ollama') as mock_compact:
+    with patch('cortex.tatlock.get_ollama_client') as get_tatlock_client, \
+         patch('hippocampus.conversation_compact.get_ollama_client') as get_compact_client:
+        mock_tatlock = get_tatlock_client.return_value
+        mock_compact = get_compact_client.return_value
         # Mock the chat method for cortex
         mock_tatlock.chat.return_value = {
             'message': {
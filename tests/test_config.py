@@ -0,0 +1,21 @@
+"""
+Tests for config module setting caches.
+"""
+
+from unittest.mock import patch
+import config
+
+
+def test_clear_settings_cache_refreshes_module_attributes(monkeypatch):
+    config.clear_settings_cache()
+    with patch.object(config, "fetch_database_settings", return_value=None), \
+            patch.object(config, "USE_DATABASE_SETTINGS", False):
+        monkeypatch.setenv("SESSION_TIMEOUT", "1800")
+        assert config.SESSION_TIMEOUT == 1800
+
+        # The value is memoized until the cache is cleared
+        monkeypatch.setenv("SESSION_TIMEOUT", "900")
+        assert config.SESSION_TIMEOUT == 1800
+        config.clear_settings_cache()
+        assert config.SESSION_TIMEOUT == 900
+    config.clear_settings_cache()
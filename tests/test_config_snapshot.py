@@ -0,0 +1,85 @@
+"""
+Tests for the resolved settings snapshot (config.py and stem.installation.config_snapshot).
+"""
+
+import os
+import pytest
+from unittest.mock import patch
+import config
+from stem.installation import config_snapshot
+
+
+def _database_settings(**overrides):
+    """Database values for every prefetched key, None unless overridden."""
+    settings = {key: None for key in config._PREFETCHED_SETTING_KEYS}
+    settings.update(overrides)
+    return settings
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    return str(tmp_path / "resolved_config.py")
+
+
+@pytest.fixture
+def clean_settings_cache():
+    config.clear_settings_cache()
+    yield
+    config.clear_settings_cache()
+
+
+def test_snapshot_round_trip(snapshot_path):
+    settings = _database_settings(hostname="tatlock.local", google_api_key="key")
+    with patch.object(config, "fetch_database_settings", return_value=settings):
+        config_snapshot.write_resolved_config(snapshot_path)
+
+    assert config.load_resolved_settings_snapshot(snapshot_path) == settings
+    # The snapshot holds API keys, so only the owner may read it
+    assert os.stat(snapshot_path).st_mode & 0o777 == 0o600
+
+
+def test_incomplete_snapshot_ignored(snapshot_path):
+    with open(snapshot_path, "w") as f:
+        f.write("DATABASE_SETTINGS = {'hostname': 'tatlock.local'}\n")
+    assert config.load_resolved_settings_snapshot(snapshot_path) == {}
+
+
+def test_write_fails_without_database(snapshot_path):
+    with patch.object(config, "fetch_database_settings", return_value=None):
+        with pytest.raises(RuntimeError):
+            config_snapshot.write_resolved_config(snapshot_path)
+    assert not os.path.exists(snapshot_path)
+
+
+def test_snapshot_precedence(monkeypatch, clean_settings_cache):
+    snapshot = _database_settings(hostname="tatlock.local")
+    monkeypatch.setenv("PORT", "9000")
+    monkeypatch.setenv("HOSTNAME", "env-host")
+    with patch.object(config, "_resolved_settings_snapshot", return_value=snapshot), \
+            patch.object(config, "fetch_database_settings") as mock_fetch:
+        config.prefetch_settings()
+        # Settings the database does not hold come from the live environment
+        assert config.get_setting_from_db_or_env("port", "PORT", "8000") == "9000"
+        assert config.get_setting_from_db_or_env("session_timeout", "SESSION_TIMEOUT", "3600") == "3600"
+        # Database values still win over the environment, as without a snapshot
+        assert config.get_setting_from_db_or_env("hostname", "HOSTNAME", "localhost") == "tatlock.local"
+        mock_fetch.assert_not_called()
+
+
+def test_refresh_only_rewrites_existing_snapshot(snapshot_path):
+    with patch.object(config, "fetch_database_settings", return_value=_database_settings(port="8080")):
+        assert config_snapshot.refresh_resolved_config(snapshot_path) is False
+        assert not os.path.exists(snapshot_path)
+
+        with open(snapshot_path, "w") as f:
+            f.write("DATABASE_SETTINGS = {}\n")
+        assert config_snapshot.refresh_resolved_config(snapshot_path) is True
+    assert config.load_resolved_settings_snapshot(snapshot_path)["port"] == "8080"
+
+
+def test_refresh_removes_snapshot_it_cannot_rewrite(snapshot_path):
+    with open(snapshot_path, "w") as f:
+        f.write("DATABASE_SETTINGS = {}\n")
+    with patch.object(config, "fetch_database_settings", return_value=None):
+        assert config_snapshot.refresh_resolved_config(snapshot_path) is False
+    assert not os.path.exists(snapshot_path)
@@ -8,9 +8,13 @@ Following Tatlock testing standards:
 """
 
 import pytest
+import sqlite3
 import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
 from hippocampus.user_database import get_database_connection, delete_user_database
-from hippocampus.conversation_compact import COMPACT_INTERVAL
+from hippocampus.conversation_compact import COMPACT_INTERVAL, create_conversation_compact
+from stem.installation.database_setup import create_longterm_db_tables
 
 
 def send_message_and_wait(client, message: str, conversation_id: str):
@@ -322,3 +326,54 @@ def test_no_compact_with_different_conversations(authenticated_user_client, test
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
+
+
+def test_verbatim_compact_of_next_range(tmp_path):
+    """
+    Test that a short range after an existing compact is stored verbatim with
+    only its own messages and the topics saved for its interactions.
+    """
+    db_path = str(tmp_path / "longterm.db")
+    create_longterm_db_tables(db_path)
+    conversation_id = "test_verbatim_range"
+    start = datetime(2026, 1, 1)
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.execute("INSERT INTO conversations (conversation_id, title) VALUES (?, ?)", (conversation_id, "Verbatim"))
+    cursor.executemany("INSERT INTO topics (topic_id, topic_name) VALUES (?, ?)", [(1, "tea"), (2, "gardening")])
+    # 50 interactions: the first 25 about tea, the rest about gardening
+    for interaction in range(1, COMPACT_INTERVAL + 1):
+        timestamp = (start + timedelta(minutes=interaction)).isoformat()
+        interaction_id = f"interaction_{interaction}"
+        cursor.executemany("""
+            INSERT INTO conversation_messages (message_id, conversation_id, message_number, role, content, timestamp)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, [
+            (f"{interaction_id}_user", conversation_id, 2 * interaction - 1, "user", f"message {2 * interaction - 1}", timestamp),
+            (f"{interaction_id}_assistant", conversation_id, 2 * interaction, "assistant", f"message {2 * interaction}", timestamp),
+        ])
+        cursor.execute("""
+            INSERT INTO memories (interaction_id, conversation_id, timestamp, user_prompt, llm_reply, full_conversation_history)
+            VALUES (?, ?, ?, '', '', '[]')
+        """, (interaction_id, conversation_id, timestamp))
+        cursor.execute("INSERT INTO memory_topics (interaction_id, topic_id) VALUES (?, ?)",
+                       (interaction_id, 1 if interaction <= 25 else 2))
+    cursor.execute("""
+        INSERT INTO conversation_compacts (compact_id, conversation_id, compact_timestamp, messages_up_to, compact_summary, topics_covered)
+        VALUES ('first', ?, ?, ?, 'summary', 'tea')
+    """, (conversation_id, start.isoformat(), COMPACT_INTERVAL))
+    conn.commit()
+    conn.close()
+
+    with patch("hippocampus.conversation_compact._summarize_with_llm") as summarize:
+        compact = create_conversation_compact("verbatim_user", conversation_id, db_path)
+
+    summarize.assert_not_called()
+    assert compact["messages_up_to"] == 2 * COMPACT_INTERVAL
+    assert compact["topics_covered"] == "gardening"
+    summary = compact["compact_summary"]
+    # Only the range after the existing compact is read, oldest first
+    assert f": message {COMPACT_INTERVAL + 1}\n" in summary
+    assert summary.endswith(f": message {2 * COMPACT_INTERVAL}")
+    assert f": message {COMPACT_INTERVAL}\n" not in summary
@@ -6,7 +6,16 @@ import cortex.tatlock as agent
 import json
 import asyncio
 from unittest.mock import patch, MagicMock, AsyncMock
-from cortex.tatlock import process_chat_interaction, run_async, AVAILABLE_TOOLS
+from cortex.tatlock import process_chat_interaction, AVAILABLE_TOOLS
+from contextlib import contextmanager
+
+
+@contextmanager
+def patch_ollama_client():
+    """Patch the shared ollama client used by cortex.tatlock and yield the client mock."""
+    with patch('cortex.tatlock.get_ollama_client') as get_client:
+        yield get_client.return_value
+
 
 class DummyOllama:
     def __init__(self):
@@ -21,9 +30,9 @@ class DummyOllama:
 
 
 def test_process_chat_interaction(monkeypatch):
-    # Patch ollama and save_interaction
+    # Patch the ollama client and save_interaction
     dummy_ollama = DummyOllama()
-    monkeypatch.setattr(agent, "ollama", dummy_ollama)
+    monkeypatch.setattr(agent, "get_ollama_client", lambda: dummy_ollama)
     monkeypatch.setattr(agent, "save_interaction", lambda **kwargs: "dummy_id")
     monkeypatch.setattr(agent, "get_base_instructions", lambda username: ["Be helpful."])
     # Patch TOOLS to empty
@@ -42,59 +51,13 @@ def test_process_chat_interaction(monkeypatch):
     assert "conversation_id" in result 
 
 
-class TestRunAsync:
-    """Test the run_async function."""
-    
-    def test_run_async_with_running_loop(self):
-        """Test run_async when there's a running event loop."""
-        async def test_coro():
-            return "test_result"
-        
-        with patch('asyncio.get_running_loop') as mock_get_loop:
-            mock_loop = MagicMock()
-            mock_loop.is_running.return_value = True
-            mock_loop.run_until_complete.return_value = "test_result"
-            mock_get_loop.return_value = mock_loop
-            
-            result = run_async(test_coro())
-            
-            assert result == "test_result"
-            mock_loop.run_until_complete.assert_called_once()
-    
-    def test_run_async_without_running_loop(self):
-        """Test run_async when there's no running event loop."""
-        async def test_coro():
-            return "test_result"
-        
-        with patch('asyncio.get_running_loop', side_effect=RuntimeError):
-            with patch('asyncio.run') as mock_run:
-                mock_run.return_value = "test_result"
-                result = run_async(test_coro())
-                assert result == "test_result"
-                mock_run.assert_called_once()
-    
-    def test_run_async_nest_asyncio_import_error(self):
-        """Test run_async when nest_asyncio is not available."""
-        async def test_coro():
-            return "test_result"
-        
-        with patch('asyncio.get_running_loop') as mock_get_loop:
-            mock_loop = MagicMock()
-            mock_loop.is_running.return_value = True
-            mock_get_loop.return_value = mock_loop
-            
-            with patch('nest_asyncio.apply', side_effect=ImportError):
-                with pytest.raises(RuntimeError, match="nest_asyncio is required"):
-                    run_async(test_coro())
-
-
 class TestProcessChatInteraction:
     """Test the main chat interaction processing."""
     
     @pytest.fixture
     def mock_ollama(self):
         """Mock ollama responses."""
-        with patch('cortex.tatlock.ollama') as mock_ollama:
+        with patch_ollama_client() as mock_ollama:
             yield mock_ollama
     
     @pytest.fixture
@@ -106,7 +69,7 @@ class TestProcessChatInteraction:
     @pytest.mark.asyncio
     async def test_basic_chat_interaction(self):
         """Test basic chat interaction."""
-        with patch('cortex.tatlock.ollama') as mock_ollama:
+        with patch_ollama_client() as mock_ollama:
             mock_ollama.chat.return_value = {
                 'message': {'role': 'assistant', 'content': 'Hello! How can I help you today?'}
             }
@@ -165,7 +128,7 @@ class TestProcessChatInteraction:
     @pytest.mark.asyncio
     async def test_tool_call_parsing_from_tool_call_tags(self):
         """Test parsing tool calls from <tool_call> tags."""
-        with patch('cortex.tatlock.ollama') as mock_ollama:
+        with patch_ollama_client() as mock_ollama:
             mock_ollama.chat.return_value = {
                 'message': {'role': 'assistant', 'content': '<tool_call>{"name": "get_weather", "args": {"location": "New York"}}</tool_call>'}
             }
@@ -184,7 +147,7 @@ class TestProcessChatInteraction:
     @pytest.mark.asyncio
     async def test_tool_call_parsing_invalid_json(self):
         """Test parsing tool calls with invalid JSON."""
-        with patch('cortex.tatlock.ollama') as mock_ollama:
+        with patch_ollama_client() as mock_ollama:
             mock_ollama.chat.return_value = {
                 'message': {'role': 'assistant', 'content': '<tool_call>{"invalid": json}</tool_call>'}
             }
@@ -353,7 +316,7 @@ class TestProcessChatInteraction:
     @pytest.mark.asyncio
     async def test_tool_failures_analysis(self):
         """Test analysis of tool failures."""
-        with patch('cortex.tatlock.ollama') as mock_ollama:
+        with patch_ollama_client() as mock_ollama:
             mock_ollama.chat.return_value = {
                 'message': {'role': 'assistant', 'content': '<tool_call>{"name": "get_weather", "args": {}}</tool_call>'}
             }
@@ -416,7 +379,7 @@ class TestProcessChatInteraction:
     @pytest.mark.asyncio
     async def test_save_interaction_failure(self):
         """Test handling save interaction failure."""
-        with patch('cortex.tatlock.ollama') as mock_ollama:
+        with patch_ollama_client() as mock_ollama:
             mock_ollama.chat.return_value = {
                 'message': {'role': 'assistant', 'content': 'Hello! How can I help you today?'}
             }
@@ -564,7 +527,7 @@ class TestProcessChatInteraction:
     @pytest.mark.asyncio
     async def test_empty_history_handling(self):
         """Test handling empty conversation history."""
-        with patch('cortex.tatlock.ollama') as mock_ollama:
+        with patch_ollama_client() as mock_ollama:
             mock_ollama.chat.return_value = {
                 'message': {'role': 'assistant', 'content': 'Hello! How can I help you today?'}
             }
@@ -583,7 +546,7 @@ class TestProcessChatInteraction:
     @pytest.mark.asyncio
     async def test_history_without_content(self):
         """Test handling history without content field."""
-        with patch('cortex.tatlock.ollama') as mock_ollama:
+        with patch_ollama_client() as mock_ollama:
             mock_ollama.chat.return_value = {
                 'message': {'role': 'assistant', 'content': 'Hello! How can I help you today?'}
             }
@@ -598,4 +561,128 @@ class TestProcessChatInteraction:
                 assert "topic" in result
                 assert "history" in result
                 assert "conversation_id" in result
-                assert "processing_time" in result 
\ No newline at end of file
+                assert "processing_time" in result 
+
+def test_collect_chat_stream_dispatches_tool_calls_early():
+    """Streamed chunks are merged and tool calls are handed over as they arrive."""
+    tool_call = {'function': {'name': 'get_weather_forecast', 'arguments': {'city': 'Amsterdam'}}}
+    started = []
+    chunks = iter([
+        {'message': {'role': 'assistant', 'content': '', 'tool_calls': [tool_call]}},
+        {'message': {'role': 'assistant', 'content': 'Checking'}},
+        {'message': {'role': 'assistant', 'content': ' now'}, 'done': True},
+    ])
+
+    response = agent._collect_chat_stream(chunks, started.append)
+
+    assert started == [tool_call]
+    assert response['done'] is True
+    assert response['message'] == {'role': 'assistant', 'content': 'Checking now', 'tool_calls': [tool_call]}
+
+def test_prepare_tool_call_ignores_non_object_arguments():
+    """Valid JSON that is not an object gives no arguments instead of raising."""
+    for arguments in ('[1]', '"Amsterdam"', '42', [1], 'not json', None):
+        assert agent._prepare_tool_call('get_weather_forecast', arguments, 'alice') == ('get_weather_forecast', {}), arguments
+    assert agent._prepare_tool_call('get_weather_forecast', '{"city": "Amsterdam"}', 'alice') == ('get_weather_forecast', {'city': 'Amsterdam'})
+    assert agent._prepare_tool_call('recall_memories', '[1]', 'alice') == ('recall_memories', {'username': 'alice'})
+
+def test_phase_3_keeps_other_results_when_arguments_are_not_an_object():
+    """One tool call with list arguments fails on its own; the other calls still run."""
+    processor = agent.TatlockProcessor()
+    context = agent.ProcessingContext(
+        original_question="Weather and tea?", username="alice", conversation_id="conv1",
+        location="London", date_time="Monday, January 05, 2026 at 09:00 AM", base_instructions=[],
+        history=[], current_phase=agent.PromptPhase.TOOL_EXECUTION,
+        tool_selection_result=agent.ToolSelectionResult(
+            selected_tools=["get_weather_forecast", "web_search"], usage_instructions="Use both tools"
+        )
+    )
+    chunks = iter([{
+        'message': {'role': 'assistant', 'content': '', 'tool_calls': [
+            {'function': {'name': 'get_weather_forecast', 'arguments': '[1]'}},
+            {'function': {'name': 'web_search', 'arguments': {'query': 'tea'}}},
+        ]},
+        'done': True,
+    }])
+    client = MagicMock()
+    client.chat.return_value = chunks
+
+    def execute_tool(function_name, **kwargs):
+        if not kwargs:
+            raise TypeError(f"{function_name} missing arguments")
+        return {"status": "success", "data": kwargs}
+
+    with patch.object(agent, "get_selected_tools", return_value=[]), \
+            patch.object(agent, "get_ollama_client", return_value=client), \
+            patch.object(agent, "execute_tool", side_effect=execute_tool):
+        results = processor._phase_3_tool_execution(context, MagicMock(enabled=False))
+
+    assert [(result["tool_name"], result["status"]) for result in results] == [
+        ("get_weather_forecast", "error"),
+        ("web_search", "success"),
+    ]
+    assert results[1]["data"] == {"query": "tea"}
+
+def test_rule_based_assessment_skips_model_for_short_guard_questions():
+    """Short identity/temporal questions are routed to the guard without an assessment call."""
+    processor = agent.TatlockProcessor()
+
+    result = processor._rule_based_assessment("What's your name?")
+    assert result.assessment_type == "CAPABILITY_GUARD"
+    assert result.guard_reason == agent.CapabilityGuardReason.IDENTITY
+    assert processor._rule_based_assessment("What time is it").guard_reason == agent.CapabilityGuardReason.TEMPORAL
+
+    # Everything else, including short questions that only mention the time or
+    # an identity and may need tools, still asks the model
+    for question in (
+        "What is the capital of France?",
+        "What time is it in Tokyo?",
+        "What is the current time in London?",
+        "Who are you meeting with today?",
+        "What's your name for my sister?",
+    ):
+        assert processor._rule_based_assessment(question) is None, question
+
+def test_repeated_direct_question_served_from_cache_and_saved():
+    """A repeated direct question is answered from the response cache without model calls, and still saved."""
+    processor = agent.TatlockProcessor()
+
+    def build_context(user_message, history, username, conversation_id):
+        return agent.ProcessingContext(
+            original_question=user_message, username=username, conversation_id=conversation_id,
+            location="London", date_time="Monday, January 05, 2026 at 09:00 AM", base_instructions=[],
+            history=list(history), current_phase=agent.PromptPhase.INITIAL_ASSESSMENT
+        )
+
+    assessment = agent.AssessmentResult(assessment_type="DIRECT", direct_response="Paris.")
+    quality = agent.QualityResult(approved=True, response="Paris is the capital of France, sir.")
+    with patch.object(processor, "_build_context", side_effect=build_context), \
+            patch.object(processor, "_phase_1_assessment", return_value=assessment) as phase_1, \
+            patch.object(processor, "_phase_4_formatting", return_value="Paris, sir."), \
+            patch.object(processor, "_phase_5_quality_gate", return_value=quality), \
+            patch.object(processor, "_save_and_compact") as save:
+        first = processor.process_question("What is the capital of France?", [], "cache_user", "conv1")
+        second = processor.process_question("what is the capital of france", [], "cache_user", "conv1")
+
+    assert phase_1.call_count == 1
+    assert second["response"] == first["response"] == "Paris is the capital of France, sir."
+    assert second["topic"] == first["topic"]
+    assert save.call_count == 2
+    assert save.call_args.args == ("what is the capital of france", second["response"], second["topic"], "cache_user", "conv1")
+
+def test_location_looked_up_per_request():
+    """A changed location is used on the next request, and each lookup is shared with that request's Phase 3."""
+    processor = agent.TatlockProcessor()
+    results = [
+        {"status": "success", "data": [{"key": "location", "value": "London"}]},
+        {"status": "success", "data": [{"key": "location", "value": "Paris"}]},
+        {"status": "error", "message": "database unavailable"},
+    ]
+    with patch.object(agent, "execute_tool", side_effect=results) as mock_tool, \
+            patch.object(agent, "get_base_instructions", return_value=[]):
+        contexts = [processor._build_context("Hello", [], "location_user", None) for _ in results]
+
+    assert [context.location for context in contexts] == ["London", "Paris", "unknown location"]
+    assert mock_tool.call_count == 3
+    key = agent._tool_call_key("find_personal_variables", {"searchkey": "location", "username": "location_user"})
+    assert [context.tool_cache for context in contexts] == [{key: result} for result in results]
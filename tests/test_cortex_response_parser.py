@@ -0,0 +1,49 @@
+"""
+Tests for cortex.response_parser module.
+"""
+
+from unittest.mock import MagicMock, patch
+import cortex.response_parser as response_parser
+from cortex.response_parser import ResponseFormatter, clear_polish_cache
+
+
+def _polishing_client(*replies):
+    """Ollama client whose chat calls return the given replies or raise the given errors."""
+    client = MagicMock()
+    client.chat.side_effect = [
+        reply if isinstance(reply, Exception) else {'message': {'content': reply}}
+        for reply in replies
+    ]
+    return client
+
+def test_short_polish_served_from_cache():
+    clear_polish_cache()
+    client = _polishing_client("Right away, sir.")
+    formatter = ResponseFormatter(model_name="test-model")
+    with patch.object(response_parser, "get_ollama_client", return_value=client):
+        assert formatter._polish_with_llm("Done.") == "Right away, sir."
+        assert formatter._polish_with_llm("Done.") == "Right away, sir."
+    assert client.chat.call_count == 1
+    clear_polish_cache()
+
+def test_long_polish_not_cached():
+    clear_polish_cache()
+    content = "word " * (response_parser._POLISH_CACHE_MAX_LENGTH // 5 + 1)
+    client = _polishing_client("First polish, sir.", "Second polish, sir.")
+    formatter = ResponseFormatter(model_name="test-model")
+    with patch.object(response_parser, "get_ollama_client", return_value=client):
+        assert formatter._polish_with_llm(content) == "First polish, sir."
+        assert formatter._polish_with_llm(content) == "Second polish, sir."
+    assert client.chat.call_count == 2
+    clear_polish_cache()
+
+def test_polish_error_not_cached():
+    clear_polish_cache()
+    client = _polishing_client(ConnectionError("ollama down"), "Right away, sir.")
+    formatter = ResponseFormatter(model_name="test-model")
+    with patch.object(response_parser, "get_ollama_client", return_value=client):
+        # A failed call falls back to the original content and is retried next time
+        assert formatter._polish_with_llm("Done.") == "Done."
+        assert formatter._polish_with_llm("Done.") == "Right away, sir."
+    assert client.chat.call_count == 2
+    clear_polish_cache()
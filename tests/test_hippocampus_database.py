@@ -5,6 +5,8 @@ import os
 import pytest
 import uuid
 import logging
+from unittest.mock import patch
+import hippocampus.database as database
 from hippocampus.user_database import ensure_user_database, delete_user_database, execute_user_query, get_database_connection
 from hippocampus.database import get_base_instructions, query_personal_variables
 
@@ -23,6 +25,17 @@ def test_get_base_instructions():
     assert any("tool" in instr.lower() for instr in instructions)
     delete_user_database(username)
 
+def test_base_instructions_served_from_cache():
+    database.clear_base_instructions_cache()
+    with patch.object(database, "_load_system_prompts", side_effect=[("first",), ("second",)]) as mock_load:
+        assert database.get_base_instructions()[0] == "first"
+        assert database.get_base_instructions()[0] == "first"
+        assert mock_load.call_count == 1
+        # Clearing the cache makes the next call read the system database
+        database.clear_base_instructions_cache()
+        assert database.get_base_instructions()[0] == "second"
+    database.clear_base_instructions_cache()
+
 def test_query_personal_variables():
     username = f"testpv_{uuid.uuid4().hex[:8]}"
     ensure_user_database(username)
@@ -0,0 +1,33 @@
+"""
+Tests for hippocampus.reference_frame module.
+"""
+
+from unittest.mock import patch
+import hippocampus.reference_frame as reference_frame
+
+
+def test_tool_catalog_failed_read_not_cached():
+    reference_frame.clear_tool_catalog_cache()
+    catalog = {"Memory": [{"key": "recall_memories", "desc": "Recall memories"}]}
+    with patch.object(reference_frame, "_load_tool_catalog", side_effect=[{}, catalog]) as mock_load:
+        assert reference_frame.get_tool_catalog_for_selection() == {}
+        assert reference_frame.get_tool_catalog_for_selection() is catalog
+        assert mock_load.call_count == 2
+    reference_frame.clear_tool_catalog_cache()
+
+def test_selected_tools_served_from_cache():
+    reference_frame.clear_tool_catalog_cache()
+    definitions = [
+        {"type": "function", "function": {"name": name, "description": name, "parameters": {}}}
+        for name in ("get_weather_forecast", "recall_memories", "web_search")
+    ]
+    with patch.object(reference_frame, "get_enabled_tools_from_db", return_value=definitions) as mock_load:
+        # Database order is kept regardless of the requested order
+        assert reference_frame.get_selected_tools(["web_search", "get_weather_forecast", "unknown"]) == [definitions[0], definitions[2]]
+        assert reference_frame.get_selected_tools(["recall_memories"]) == [definitions[1]]
+        assert mock_load.call_count == 1
+        # Enabling or disabling a tool clears the definitions too
+        reference_frame.clear_tool_catalog_cache()
+        reference_frame.get_selected_tools(["recall_memories"])
+        assert mock_load.call_count == 2
+    reference_frame.clear_tool_catalog_cache()
@@ -90,4 +90,36 @@ def test_update_conversation_topics_after_save_interaction():
     assert link_row[0] == conversation_id
     assert link_row[1] == topic_id
     conn.close()
-    delete_user_database(username) 
\ No newline at end of file
+    delete_user_database(username)
+
+
+def test_save_interaction_records_conversation():
+    username = "testconvrecord"
+    ensure_user_database(username)
+    conversation_id = "convrecord1"
+    try:
+        for prompt in ("First question", "Second question"):
+            interaction_id = save_interaction(
+                user_prompt=prompt,
+                llm_reply="An answer.",
+                full_llm_history=[],
+                topic="records",
+                username=username,
+                conversation_id=conversation_id
+            )
+            assert interaction_id is not None
+        # Check that both exchanges are counted on the conversation record
+        conn = get_database_connection(username)
+        assert conn is not None
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT title, message_count FROM conversations WHERE conversation_id = ?", (conversation_id,))
+            row = cursor.fetchone()
+        finally:
+            conn.close()
+        assert row is not None
+        assert row[0] == "Conversation about records"
+        assert row[1] == 4
+    finally:
+        # Remove the test database even when an assertion fails
+        delete_user_database(username)
@@ -4,7 +4,7 @@ Tests for stem.jsonutils module.
 
 import pytest
 import json
-from stem.jsonutils import to_json, from_json
+from stem.jsonutils import to_json, from_json, parse_json, dump_json
 
 
 class TestToJson:
@@ -314,4 +314,46 @@ class TestRoundTrip:
         json_str = to_json(original)
         result = from_json(json_str)
         
-        assert result == original 
\ No newline at end of file
+        assert result == original 
+
+class TestParseJson:
+    """Test strict JSON deserialization."""
+    
+    def test_string_input(self):
+        """Test parsing a JSON string."""
+        assert parse_json('{"name": "John", "items": [1, 2]}') == {"name": "John", "items": [1, 2]}
+    
+    def test_bytes_input(self):
+        """Test parsing raw bytes such as an HTTP response body."""
+        assert parse_json('{"city": "Zürich"}'.encode("utf-8")) == {"city": "Zürich"}
+    
+    def test_invalid_json_raises(self):
+        """Test that invalid JSON raises ValueError instead of returning None."""
+        with pytest.raises(ValueError):
+            parse_json('{"name": "John",}')
+
+
+class TestDumpJson:
+    """Test strict compact JSON serialization."""
+    
+    def test_round_trip(self):
+        """Test that compact output parses back to the original object."""
+        data = [{"role": "user", "content": "Hello, 世界!"}, {"role": "assistant", "content": None}]
+        assert parse_json(dump_json(data)) == data
+    
+    def test_compact_output(self):
+        """Test that no whitespace is added between tokens."""
+        assert dump_json({"a": [1, 2]}) == '{"a":[1,2]}'
+    
+    def test_unserializable_raises(self):
+        """Test that non-serializable objects raise TypeError instead of returning ''."""
+        with pytest.raises(TypeError):
+            dump_json({"value": object()})
+    
+    def test_sort_keys_is_canonical(self):
+        """Test that sorted output does not depend on insertion order."""
+        assert dump_json({"b": 1, "a": 2}, sort_keys=True) == dump_json({"a": 2, "b": 1}, sort_keys=True) == '{"a":2,"b":1}'
+    
+    def test_default_fallback(self):
+        """Test that the default hook serializes otherwise unsupported objects."""
+        assert dump_json({"value": {1}}, default=list) == '{"value":[1]}'
@@ -0,0 +1,47 @@
+"""
+Tests for stem.ollama_client module.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from stem.ollama_client import cached_chat, clear_chat_cache
+
+
+class TestCachedChat:
+    """Test memoization of deterministic chat requests."""
+
+    def setup_method(self):
+        clear_chat_cache()
+
+    def test_deterministic_request_is_reused(self):
+        """Test that an identical temperature-0 request is answered from the cache."""
+        client = MagicMock()
+        messages = [{"role": "user", "content": "Summarize"}]
+        first = cached_chat(client, model="m", messages=messages, options={"temperature": 0})
+        second = cached_chat(client, model="m", messages=list(messages), options={"temperature": 0})
+        assert first is second
+        assert client.chat.call_count == 1
+
+    def test_different_request_is_not_reused(self):
+        """Test that a change in the messages misses the cache."""
+        client = MagicMock()
+        cached_chat(client, model="m", messages=[{"role": "user", "content": "a"}], options={"temperature": 0})
+        cached_chat(client, model="m", messages=[{"role": "user", "content": "b"}], options={"temperature": 0})
+        assert client.chat.call_count == 2
+
+    def test_sampled_request_is_not_cached(self):
+        """Test that requests without temperature 0 always reach the model."""
+        client = MagicMock()
+        messages = [{"role": "user", "content": "Hello"}]
+        cached_chat(client, model="m", messages=messages)
+        cached_chat(client, model="m", messages=messages)
+        assert client.chat.call_count == 2
+
+    def test_failed_request_is_not_cached(self):
+        """Test that an error is raised to the caller and retried next time."""
+        client = MagicMock()
+        client.chat.side_effect = [RuntimeError("down"), {"message": {"content": "ok"}}]
+        messages = [{"role": "user", "content": "Summarize"}]
+        with pytest.raises(RuntimeError):
+            cached_chat(client, model="m", messages=messages, options={"temperature": 0})
+        assert cached_chat(client, model="m", messages=messages, options={"temperature": 0}) == {"message": {"content": "ok"}}
@@ -652,9 +652,10 @@ class TestSystemHealth:
 class TestBenchmarkFunctions:
     """Test benchmark functions."""
     
-    @patch('parietal.hardware.ollama')
-    def test_run_llm_benchmark_success(self, mock_ollama):
+    @patch('parietal.hardware.get_ollama_client')
+    def test_run_llm_benchmark_success(self, mock_get_client):
         """Test successful LLM benchmark."""
+        mock_ollama = mock_get_client.return_value
         mock_ollama.chat.return_value = {
             'message': {'content': 'Hello'}
         }
@@ -670,9 +671,10 @@ class TestBenchmarkFunctions:
         assert "complex_reasoning" in result["tests"]
         assert result["tests"]["simple_response"]["status"] == "success"
     
-    @patch('parietal.hardware.ollama')
-    def test_run_llm_benchmark_with_tool_calling(self, mock_ollama):
+    @patch('parietal.hardware.get_ollama_client')
+    def test_run_llm_benchmark_with_tool_calling(self, mock_get_client):
         """Test LLM benchmark with tool calling."""
+        mock_ollama = mock_get_client.return_value
         mock_ollama.chat.return_value = {
             'message': {'content': 'Weather is sunny', 'tool_calls': [{'id': '1'}]}
         }
@@ -683,9 +685,10 @@ class TestBenchmarkFunctions:
         assert result["tests"]["tool_calling"]["status"] == "success"
         assert result["tests"]["tool_calling"]["has_tool_calls"] is True
     
-    @patch('parietal.hardware.ollama')
-    def test_run_llm_benchmark_tool_calling_failure(self, mock_ollama):
+    @patch('parietal.hardware.get_ollama_client')
+    def test_run_llm_benchmark_tool_calling_failure(self, mock_get_client):
         """Test LLM benchmark with tool calling failure."""
+        mock_ollama = mock_get_client.return_value
         def mock_chat(*args, **kwargs):
             if 'tools' in kwargs:
                 raise Exception("Tool calling not supported")
@@ -699,9 +702,10 @@ class TestBenchmarkFunctions:
         assert result["tests"]["tool_calling"]["status"] == "failed"
         assert "error" in result["tests"]["tool_calling"]
     
-    @patch('parietal.hardware.ollama')
-    def test_run_llm_benchmark_complete_failure(self, mock_ollama):
+    @patch('parietal.hardware.get_ollama_client')
+    def test_run_llm_benchmark_complete_failure(self, mock_get_client):
         """Test LLM benchmark with complete failure."""
+        mock_ollama = mock_get_client.return_value
         mock_ollama.chat.side_effect = Exception("Ollama not available")
         
         result = run_llm_benchmark()
@@ -0,0 +1,76 @@
+"""
+Tests for cortex.response_cache module.
+"""
+
+from unittest.mock import patch
+from cortex import response_cache
+from cortex.response_cache import ResponseCache, normalize_question, context_fingerprint
+
+DATE = "Wednesday, January 31, 2024"
+LOCATION = "London, UK"
+
+
+class TestNormalizeQuestion:
+    """Test question normalization for cache keys."""
+
+    def test_ignores_case_whitespace_and_trailing_punctuation(self):
+        """Test that trivially different phrasings share one key."""
+        assert normalize_question("  What is  the capital of France? ") == normalize_question("what is the capital of france")
+
+
+class TestContextFingerprint:
+    """Test fingerprinting of the conversation context."""
+
+    def test_only_last_three_messages_without_compact(self):
+        """Test that older messages outside the prompt window do not matter."""
+        recent = [{"role": "user", "content": f"message {i}"} for i in range(3)]
+        older = [{"role": "user", "content": "old"}]
+        assert context_fingerprint(older + recent, None, DATE, LOCATION) == context_fingerprint(recent, None, DATE, LOCATION)
+
+    def test_differs_with_context(self):
+        """Test that a different conversation gives a different fingerprint."""
+        history = [{"role": "user", "content": "Tell me about tea"}]
+        assert context_fingerprint(history, None, DATE, LOCATION) != context_fingerprint([], None, DATE, LOCATION)
+        assert context_fingerprint([], "summary", DATE, LOCATION) != context_fingerprint([], None, DATE, LOCATION)
+
+    def test_differs_with_date_and_location(self):
+        """Test that answers are not reused on another day or in another place."""
+        fingerprint = context_fingerprint([], None, DATE, LOCATION)
+        assert context_fingerprint([], None, "Thursday, February 01, 2024", LOCATION) != fingerprint
+        assert context_fingerprint([], None, DATE, "Paris, France") != fingerprint
+
+
+class TestResponseCache:
+    """Test the per-user TTL/LRU answer cache."""
+
+    def test_hit_after_put(self):
+        """Test that a stored answer is returned for the same question and context."""
+        cache = ResponseCache()
+        cache.put("alice", "What is tea?", "ctx", "A beverage, sir.", "tea")
+        assert cache.get("alice", "what is tea", "ctx") == ("A beverage, sir.", "tea")
+
+    def test_isolated_per_user_and_context(self):
+        """Test that answers are never shared across users or contexts."""
+        cache = ResponseCache()
+        cache.put("alice", "What is tea?", "ctx", "A beverage, sir.", "tea")
+        assert cache.get("bob", "What is tea?", "ctx") is None
+        assert cache.get("alice", "What is tea?", "other") is None
+
+    def test_entries_expire(self):
+        """Test that entries are dropped once their TTL has passed."""
+        cache = ResponseCache(ttl=10.0)
+        with patch.object(response_cache.time, "monotonic", side_effect=[100.0, 105.0, 110.0]):
+            cache.put("alice", "What is tea?", "ctx", "A beverage, sir.", "tea")
+            assert cache.get("alice", "What is tea?", "ctx") is not None
+            assert cache.get("alice", "What is tea?", "ctx") is None
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest unused entry is evicted when full."""
+        cache = ResponseCache(max_size=2)
+        cache.put("alice", "first", "ctx", "1", "t")
+        cache.put("alice", "second", "ctx", "2", "t")
+        cache.get("alice", "first", "ctx")
+        cache.put("alice", "third", "ctx", "3", "t")
+        assert cache.get("alice", "second", "ctx") is None
+        assert cache.get("alice", "first", "ctx") == ("1", "t")
+        assert cache.get("alice", "third", "ctx") == ("3", "t")
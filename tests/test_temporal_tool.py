@@ -0,0 +1,66 @@
+"""
+Tests for cerebellum.temporal_tool module.
+"""
+
+import pytest
+from datetime import date, datetime
+from cerebellum.temporal_tool import _parse_temporal_expression
+
+# Wednesday
+NOW = datetime(2024, 1, 31, 15, 30)
+TODAY = NOW.date()
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("today", date(2024, 1, 31)),
+    ("now", date(2024, 1, 31)),
+    ("yesterday", date(2024, 1, 30)),
+    ("tomorrow", date(2024, 2, 1)),
+    ("current time", None),
+    # Weekdays, with the modifier before or after the day name
+    ("last friday", date(2024, 1, 26)),
+    ("friday last week", date(2024, 1, 26)),
+    ("last week friday", date(2024, 1, 26)),
+    ("what happened last wednesday", date(2024, 1, 24)),
+    ("next monday", date(2024, 2, 5)),
+    ("monday next week", date(2024, 2, 5)),
+    ("this sunday", date(2024, 2, 4)),
+    ("this wednesday", date(2024, 1, 31)),
+    # Relative amounts
+    ("3 days ago", date(2024, 1, 28)),
+    ("2 weeks from now", date(2024, 2, 14)),
+    ("1 month later", date(2024, 2, 29)),
+    ("1 year ago", date(2023, 1, 31)),
+    # Periods
+    ("this week", date(2024, 1, 29)),
+    ("last week", date(2024, 1, 22)),
+    ("next week", date(2024, 2, 5)),
+    ("this month", date(2024, 1, 1)),
+    ("last month", date(2023, 12, 1)),
+    ("next month", date(2024, 2, 1)),
+    ("this year", date(2024, 1, 1)),
+    ("last year", date(2023, 1, 1)),
+    ("next year", date(2025, 1, 1)),
+    # Period boundaries
+    ("beginning of month", date(2024, 1, 1)),
+    ("start of the week", date(2024, 1, 29)),
+    ("start of year", date(2024, 1, 1)),
+    ("end of month", date(2024, 1, 31)),
+    ("end of this week", date(2024, 2, 4)),
+    ("end of the year", date(2024, 12, 31)),
+    ("no date here", None),
+])
+def test_parse_temporal_expression(query, expected):
+    target_date, _ = _parse_temporal_expression(query, NOW, TODAY)
+    assert target_date == expected
+
+
+@pytest.mark.parametrize("query, refers_to_now", [
+    ("now", True),
+    ("current time", True),
+    ("yesterday", False),
+    ("last friday", False),
+])
+def test_parse_temporal_expression_datetime(query, refers_to_now):
+    _, target_datetime = _parse_temporal_expression(query, NOW, TODAY)
+    assert target_datetime == (NOW if refers_to_now else None)
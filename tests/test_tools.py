@@ -398,4 +398,19 @@ class TestToolErrorHandling:
         # Test weather tool with invalid date format
         result = execute_get_weather_forecast("Amsterdam", "invalid-date")
         # The function doesn't validate date formats, so it will try to make the request
-        assert result["status"] == "error" or result["status"] == "success" 
\ No newline at end of file
+        assert result["status"] == "error" or result["status"] == "success" 
+
+class TestExecuteTool:
+    """Test dispatch through stem.tools.execute_tool."""
+
+    def test_execute_async_tool(self):
+        """Test that coroutine tools are awaited and their result returned."""
+        from stem.tools import execute_tool
+
+        async def async_tool(city):
+            return {"status": "success", "data": f"weather for {city}"}
+
+        with patch('stem.tools.get_tool_function', return_value=async_tool):
+            result = execute_tool("async_weather", city="Amsterdam")
+
+        assert result == {"status": "success", "data": "weather for Amsterdam"}
@@ -0,0 +1,42 @@
+"""
+Tests for stem.ttlcache module.
+"""
+
+from unittest.mock import MagicMock, patch
+from stem import ttlcache
+from stem.ttlcache import TTLMemo
+
+
+def test_memo_expires_after_ttl():
+    loader = MagicMock(side_effect=["first", "second"])
+    memo = TTLMemo(loader, ttl=60.0)
+    with patch.object(ttlcache.time, "monotonic", side_effect=[100.0, 110.0, 160.0]):
+        # Within the TTL the loaded value is reused
+        assert memo.get() == "first"
+        assert memo.get() == "first"
+        # Once the TTL has passed the loader runs again
+        assert memo.get() == "second"
+    assert loader.call_count == 2
+
+def test_memo_clear_forces_reload():
+    loader = MagicMock(side_effect=["first", "second"])
+    memo = TTLMemo(loader, ttl=60.0)
+    assert memo.get() == "first"
+    memo.clear()
+    assert memo.get() == "second"
+
+def test_memo_empty_result():
+    # Empty results are kept by default
+    loader = MagicMock(side_effect=[{}, {"key": "value"}])
+    memo = TTLMemo(loader, ttl=60.0)
+    assert memo.get() == {}
+    assert memo.get() == {}
+    assert loader.call_count == 1
+
+    # With cache_empty=False a failed read is retried on the next call
+    loader = MagicMock(side_effect=[{}, {"key": "value"}])
+    memo = TTLMemo(loader, ttl=60.0, cache_empty=False)
+    assert memo.get() == {}
+    assert memo.get() == {"key": "value"}
+    assert memo.get() == {"key": "value"}
+    assert loader.call_count == 2